@@ -0,0 +1,3 @@
+"""
+벤치마크 (python -m bench.run) — 가짜 Supabase 로 제출/관리자 경로를 측정합니다.
+"""
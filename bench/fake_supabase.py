@@ -0,0 +1,254 @@
+"""
+벤치마크용 로컬 Supabase 대역 (PostgREST + Storage, 프로세스 안 HTTP 서버)
+
+- submissions 테이블: 제출시간 순으로 정렬해 두고 gte/lte 는 이분 탐색 → 10만 행에서도 페이지 조회가 가볍습니다.
+- rpc/submission_stats, Storage 업로드(POST/PUT)·존재 확인(HEAD)·서명 URL(단건/일괄)을 흉내 냅니다.
+- 재개 가능(TUS) 업로드: /storage/v1/upload/resumable 의 POST(생성)·HEAD(오프셋)·PATCH(청크).
+  fail_next_patches(n, after=k) 로 k 번 정상 처리한 뒤 n 번의 PATCH 를 청크 절반만 받고 연결을 끊게 하고,
+  expire_uploads() 로 진행 중인 업로드를 지워 404 → 재생성 경로를 재현합니다.
+- latency 초만큼 모든 요청을 지연시켜 네트워크 왕복을 모사합니다.
+"""
+import base64
+import bisect
+import json
+import threading
+import time
+from datetime import datetime, timedelta
+from email.parser import BytesParser
+from email.policy import HTTP
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlparse
+
+ORDER_COL = "제출시간"
+TUS_PATH = "/storage/v1/upload/resumable"
+
+
+class FakeState:
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.rows: list[dict] = []   # 제출시간 오름차순
+        self._keys: list[str] = []   # rows 의 제출시간 (이분 탐색용)
+        self.objects: dict[tuple[str, str], bytes] = {}
+        self.tus_uploads: dict[str, dict] = {}  # 업로드 ID → {bucket, object, length, data}
+        self.tus_patch_failures = 0             # 남은 '중간에 끊기는' PATCH 수
+        self.tus_patch_ok_before_fail = 0       # 끊기 전에 정상 처리할 PATCH 수
+        self.tus_patches = 0
+        self.requests = 0
+        self.lock = threading.Lock()
+
+    def seed_submissions(self, n: int, users: int = 50, start: datetime | None = None):
+        """제출 n 건을 만듭니다 (사용자 users 명, 1분 간격)."""
+        start = start or datetime(2025, 1, 1, 9, 0, 0)
+        rows = []
+        for i in range(n):
+            t0 = start + timedelta(minutes=i)
+            rows.append({
+                "사용자": f"SR{i % users + 1:02d}",
+                "시작시간": t0.isoformat() + "+09:00",
+                "제출시간": (t0 + timedelta(seconds=300)).isoformat() + "+09:00",
+                "소요시간(초)": 300,
+                "식단표종류": "식단표A" if i % 2 else "식단표B",
+                "파일경로": f"blobs/{i % 256:02x}/{i:064x}.xlsx",
+                "원본파일명": f"submission_{i}.xlsx",
+            })
+        with self.lock:
+            self.rows = rows
+            self._keys = [r[ORDER_COL] for r in rows]
+
+    def insert(self, rows: list[dict]):
+        with self.lock:
+            for r in rows:
+                i = bisect.bisect_right(self._keys, r.get(ORDER_COL, ""))
+                self._keys.insert(i, r.get(ORDER_COL, ""))
+                self.rows.insert(i, r)
+
+    def select(self, query: dict) -> list[dict]:
+        with self.lock:
+            lo, hi = 0, len(self.rows)
+            for key, values in query.items():
+                if key in ("select", "order", "limit", "offset"):
+                    continue
+                op, _, val = values[0].partition(".")
+                if key != ORDER_COL:
+                    raise ValueError(f"unsupported filter column: {key}")
+                if op == "gte":
+                    lo = max(lo, bisect.bisect_left(self._keys, val))
+                elif op == "gt":
+                    lo = max(lo, bisect.bisect_right(self._keys, val))
+                elif op == "lte":
+                    hi = min(hi, bisect.bisect_right(self._keys, val))
+                elif op == "lt":
+                    hi = min(hi, bisect.bisect_left(self._keys, val))
+            desc = query.get("order", [""])[0].endswith(".desc")
+            offset = int(query.get("offset", ["0"])[0])
+            limit = int(query.get("limit", ["0"])[0]) or (hi - lo)
+            if desc:
+                end = max(lo, hi - offset)
+                picked = self.rows[max(lo, end - limit):end][::-1]
+            else:
+                start = min(hi, lo + offset)
+                picked = self.rows[start:min(hi, start + limit)]
+        if "select" in query and query["select"][0] != "*":
+            cols = [c.strip('"') for c in query["select"][0].split(",")]
+            picked = [{c: r.get(c) for c in cols} for r in picked]
+        return picked
+
+    def fail_next_patches(self, n: int = 1, after: int = 0):
+        with self.lock:
+            self.tus_patch_failures = n
+            self.tus_patch_ok_before_fail = after
+
+    def expire_uploads(self):
+        """진행 중인 TUS 업로드를 모두 지웁니다 (다음 HEAD/PATCH 는 404)."""
+        with self.lock:
+            self.tus_uploads.clear()
+
+    def stats(self) -> dict:
+        with self.lock:
+            rows = list(self.rows)
+        avg = sum(r.get("소요시간(초)", 0) for r in rows) / len(rows) if rows else 0
+        return {"total": len(rows), "users": len({r.get("사용자") for r in rows}), "avg_sec": avg, "today": 0}
+
+
+def _multipart_file(content_type: str, body: bytes) -> bytes:
+    if not content_type.startswith("multipart/"):
+        return body
+    msg = BytesParser(policy=HTTP).parsebytes(b"Content-Type: " + content_type.encode() + b"\r\n\r\n" + body)
+    for part in msg.iter_parts():
+        if part.get_filename():
+            return part.get_payload(decode=True)
+    return body
+
+
+def _tus_metadata(header: str) -> dict:
+    # "key base64,key base64" → {key: 값}
+    out = {}
+    for item in filter(None, (p.strip() for p in header.split(","))):
+        key, _, value = item.partition(" ")
+        out[key] = base64.b64decode(value).decode("utf-8") if value else ""
+    return out
+
+
+def _make_handler(state: FakeState):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive (연결 풀 재사용 측정)
+        disable_nagle_algorithm = True  # 헤더/본문 분할 전송 시 지연 ACK(40ms) 방지
+
+        def log_message(self, *args):
+            pass
+
+        def _send(self, code: int, obj=None, headers: dict | None = None):
+            data = b"" if obj is None else json.dumps(obj, ensure_ascii=False).encode("utf-8")
+            self.send_response(code)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            if self.command != "HEAD":
+                self.wfile.write(data)
+
+        def _route(self):
+            if state.latency:
+                time.sleep(state.latency)
+            with state.lock:
+                state.requests += 1
+            u = urlparse(self.path)
+            path = unquote(u.path)
+            query = parse_qs(u.query, keep_blank_values=True)
+            n = int(self.headers.get("Content-Length") or 0)
+            body = self.rfile.read(n) if n else b""
+            method = self.command
+
+            if path.startswith(TUS_PATH):
+                return self._tus(method, path[len(TUS_PATH):].strip("/"), body)
+            if path.startswith("/rest/v1/rpc/submission_stats"):
+                return self._send(200, [state.stats()])
+            if path.startswith("/rest/v1/submissions"):
+                if method == "POST":
+                    data = json.loads(body or b"[]")
+                    rows = data if isinstance(data, list) else [data]
+                    state.insert(rows)
+                    return self._send(201, rows)
+                return self._send(200, state.select(query))
+            if path.startswith("/storage/v1/object/sign/"):
+                bucket, _, obj = path[len("/storage/v1/object/sign/"):].partition("/")
+                if obj:
+                    return self._send(200, {"signedURL": f"/object/sign/{bucket}/{obj}?token=t"})
+                paths = json.loads(body or b"{}").get("paths", [])
+                return self._send(200, [{"path": p, "signedURL": f"/object/sign/{bucket}/{p}?token=t", "error": None}
+                                        for p in paths])
+            if path.startswith("/storage/v1/object/"):
+                bucket, _, obj = path[len("/storage/v1/object/"):].partition("/")
+                if method == "HEAD":
+                    return self._send(200 if (bucket, obj) in state.objects else 400)
+                if method in ("POST", "PUT"):
+                    with state.lock:
+                        state.objects[(bucket, obj)] = _multipart_file(self.headers.get("Content-Type", ""), body)
+                    return self._send(200, {"Key": f"{bucket}/{obj}", "Id": "bench"})
+            return self._send(404, {"error": "not found", "path": path})
+
+        def _tus(self, method: str, upload_id: str, body: bytes):
+            if method == "POST" and not upload_id:
+                meta = _tus_metadata(self.headers.get("Upload-Metadata", ""))
+                with state.lock:
+                    upload_id = f"u{len(state.tus_uploads)}-{state.requests}"
+                    state.tus_uploads[upload_id] = {
+                        "bucket": meta.get("bucketName", ""), "object": meta.get("objectName", ""),
+                        "length": int(self.headers.get("Upload-Length") or 0), "data": bytearray(),
+                    }
+                return self._send(201, headers={"Location": f"{TUS_PATH}/{upload_id}", "Tus-Resumable": "1.0.0"})
+            with state.lock:
+                upload = state.tus_uploads.get(upload_id)
+            if upload is None:
+                return self._send(404, {"error": "upload not found"})
+            if method == "HEAD":
+                return self._send(200, headers={"Upload-Offset": str(len(upload["data"])),
+                                                "Upload-Length": str(upload["length"])})
+            if method != "PATCH":
+                return self._send(405)
+            if int(self.headers.get("Upload-Offset") or -1) != len(upload["data"]):
+                return self._send(409, {"error": "offset mismatch"})
+            with state.lock:
+                state.tus_patches += 1
+                if state.tus_patch_ok_before_fail:
+                    state.tus_patch_ok_before_fail -= 1
+                    interrupted = False
+                else:
+                    interrupted = state.tus_patch_failures > 0
+                if interrupted:
+                    state.tus_patch_failures -= 1
+                    body = body[:len(body) // 2]  # 전송 도중 끊김: 절반만 도착
+                upload["data"].extend(body)
+                if len(upload["data"]) >= upload["length"]:
+                    state.objects[(upload["bucket"], upload["object"])] = bytes(upload["data"])
+            if interrupted:
+                self.close_connection = True  # 응답 없이 연결 종료 → 클라이언트는 HEAD 로 오프셋 확인
+                return None
+            return self._send(204, headers={"Upload-Offset": str(len(upload["data"])), "Tus-Resumable": "1.0.0"})
+
+        do_GET = do_POST = do_PUT = do_PATCH = do_HEAD = _route
+
+    return Handler
+
+
+class FakeSupabase:
+    """with FakeSupabase(latency=0.005) as fake: fake.url ..."""
+
+    def __init__(self, latency: float = 0.0):
+        self.state = FakeState(latency)
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _make_handler(self.state))
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
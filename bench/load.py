@@ -0,0 +1,362 @@
+"""
+동시 세션 부하 테스트 (AppTest 기반, SR01–SR13 + admin)
+
+    python -m bench.load                        # SR01–SR13 + admin 각 1세션, 가짜 Supabase(지연 20ms)
+    python -m bench.load --scale 3              # 3배 (계정마다 세션 3개 = 탭 3개)
+    python -m bench.load --offline              # Supabase 연결 불가 → 로컬 백업 경로만
+    python -m bench.load --same-file --json load.json
+    python -m bench.load --log-wait-ms 100      # log.csv 잠금 대기 한도(p95) 조정
+
+- 세션마다 AppTest 하나를 스레드에서 돌려 로그인 → 식단표 선택 → "🍽️ 식단 설계 시작" → 업로드(검증) → 제출을
+  재현합니다. 제출은 모든 세션이 동시에 누르도록 맞춥니다. admin 세션은 그동안 대시보드를 계속 다시 그립니다.
+- 단계별 리런 지연(p50/p95/최대), 세션당 메모리(RSS 증가분 / 세션 수), 제출 처리 span 을 출력합니다.
+- 공유 파일 경합 점검: log.csv 행 누락, log.csv 잠금 대기(submit.log_csv p95 > --log-wait-ms),
+  uploads/ 백업 파일명 충돌, 리런 예외. 문제가 있으면 종료 코드 1.
+
+AppTest 는 리런마다 가짜 Runtime 을 새로 만들어 전역(Runtime._instance)에 넣었다가 지웁니다.
+여러 세션을 동시에 돌리면 서로의 Runtime 을 지워 버리므로, 하네스가 Runtime 하나를 고정해 두고
+AppTest 쪽 교체는 무시하게 합니다 (실제 서버처럼 st.cache_data 저장소도 모든 세션이 공유).
+스크립트 바이트코드 캐시(ScriptCache)도 서버처럼 하나를 공유합니다 — 세션마다 app.py 를 동시에
+컴파일하면 느릴 뿐 아니라 Python 3.11 에서는 ast.parse 가 SystemError 로 실패하기도 합니다.
+이 고정은 AppTest 내부 구조에 기대므로 Streamlit 1.65 에 맞춰 두었습니다 (STREAMLIT_PINNED).
+다른 버전이면 경고하고, 바꿔 끼울 자리가 없으면 바로 중단합니다.
+"""
+import argparse
+import io
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from bench.fake_supabase import FakeSupabase
+from bench.run import REPO_DIR, _prepare_workdir, percentile
+
+APP_PATH = os.path.join(REPO_DIR, "app.py")
+ASSETS = ("templates", "menu.xlsx")            # 작업 폴더에 링크할 읽기 전용 파일
+OFFLINE_URL = "http://127.0.0.1:9"             # 연결 거부 → 서킷 열림, 로컬 백업만
+USERS = [(f"SR{i:02d}", f"test{i:02d}") for i in range(1, 14)]  # app.py 의 user_dict 와 같은 계정
+ADMIN = ("admin", "admin")
+XLSX_MIME = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+LOG_CSV_WAIT_MS = 250.0                        # 기본값: submit.log_csv p95 가 이보다 크면 잠금 경합으로 표시
+STREAMLIT_PINNED = "1.65"                      # _pin_runtime 이 맞춰 둔 Streamlit 버전
+RUN_TIMEOUT = 120.0
+
+
+class _RuntimeSlot:
+    # AppTest 가 리런마다 쓰는 Runtime._instance 자리 (여기에 쓰면 실제 Runtime 에는 영향 없음)
+    _instance = None
+
+
+def _pin_runtime():
+    """
+    모든 AppTest 세션이 공유할 Runtime / ScriptCache 를 고정합니다.
+    Streamlit 1.65 의 비공개 구조(app_test.Runtime·ScriptCache, local_script_runner.ScriptCache,
+    AppTest 가 채우는 Runtime 관리자 속성)를 그대로 흉내 냅니다.
+    """
+    from unittest.mock import MagicMock
+
+    import streamlit
+    from streamlit import config
+
+    version = streamlit.__version__
+    try:
+        from streamlit.components.v2.component_manager import BidiComponentManager
+        from streamlit.runtime import Runtime
+        from streamlit.runtime.caching.storage.dummy_cache_storage import MemoryCacheStorageManager
+        from streamlit.runtime.dataframe_source_manager import DataframeSourceManager
+        from streamlit.runtime.media_file_manager import MediaFileManager
+        from streamlit.runtime.memory_media_file_storage import MemoryMediaFileStorage
+        from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+        from streamlit.testing.v1 import app_test, local_script_runner
+    except ImportError as e:
+        raise SystemExit(f"bench.load: Streamlit {version} 의 AppTest 내부 구조가 "
+                         f"{STREAMLIT_PINNED} 과 달라 실행할 수 없습니다 ({e})")
+    missing = [f"{mod.__name__}.{attr}" for mod, attr in (
+        (app_test, "Runtime"), (app_test, "ScriptCache"), (local_script_runner, "ScriptCache"),
+    ) if not hasattr(mod, attr)]
+    if missing:
+        raise SystemExit(f"bench.load: Streamlit {version} 에는 고정할 자리가 없습니다: {', '.join(missing)} "
+                         f"({STREAMLIT_PINNED} 기준)")
+    if not version.startswith(STREAMLIT_PINNED + "."):
+        print(f"⚠️ bench.load 는 Streamlit {STREAMLIT_PINNED} 기준입니다 (설치: {version}) — "
+              "세션 간 간섭이 보이면 _pin_runtime 을 확인하세요", file=sys.stderr)
+
+    runtime = MagicMock(spec=Runtime)
+    runtime.media_file_mgr = MediaFileManager(MemoryMediaFileStorage("/mock/media"))
+    runtime.dataframe_source_mgr = DataframeSourceManager()
+    runtime.cache_storage_manager = MemoryCacheStorageManager()
+    bidi = BidiComponentManager()
+    bidi.discover_and_register_components(start_file_watching=False)
+    runtime.bidi_component_registry = bidi
+    Runtime._instance = runtime
+    app_test.Runtime = _RuntimeSlot
+    script_cache = ScriptCache()
+    app_test.ScriptCache = local_script_runner.ScriptCache = lambda: script_cache
+    # AppTest 는 리런 동안만 켰다가 원래 값으로 되돌리므로, 처음부터 켜 두면 겹쳐도 꺼지지 않음
+    config.set_option("global.appTest", True)
+
+
+def _rss_bytes() -> int:
+    # 현재 RSS (리눅스 /proc, 그 외는 최대 RSS 로 대체)
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def _submission_file(meal_type: str, author: str, same_file: bool) -> bytes:
+    # 템플릿에 작성자만 바꿔 저장 → 검증은 통과하고 내용(해시)은 세션마다 다름
+    from openpyxl import load_workbook
+    from template_registry import get_template_file
+
+    data = get_template_file(meal_type)
+    if data is None:
+        raise SystemExit(f"{meal_type} 템플릿을 찾지 못했습니다 (templates/)")
+    if same_file:
+        return data
+    wb = load_workbook(io.BytesIO(data))
+    wb.properties.creator = author
+    out = io.BytesIO()
+    wb.save(out)
+    return out.getvalue()
+
+
+def _find(widgets, label: str):
+    for w in widgets:
+        if w.label == label:
+            return w
+    raise LookupError(f"위젯을 찾지 못했습니다: {label}")
+
+
+class Session:
+    """AppTest 세션 하나 + 단계별 리런 시간 기록."""
+
+    def __init__(self, username: str, password: str, index: int):
+        from streamlit.testing.v1 import AppTest
+
+        self.username = username
+        self.password = password
+        self.index = index
+        self.at = AppTest.from_file(APP_PATH, default_timeout=RUN_TIMEOUT)
+        self.timings: list[tuple[str, float]] = []
+        self.errors: list[str] = []
+
+    @property
+    def name(self) -> str:
+        return f"{self.username}#{self.index}"
+
+    def run(self, step: str):
+        start = time.perf_counter()
+        try:
+            self.at.run()
+        finally:
+            self.timings.append((step, (time.perf_counter() - start) * 1000))
+        for exc in self.at.exception:
+            self.errors.append(f"{self.name} {step}: {exc.message}")
+
+    def login(self):
+        self.run("open")
+        self.at.text_input[0].input(self.username)
+        self.at.text_input[1].input(self.password)
+        _find(self.at.button, "🚀 로그인").click()
+        self.run("login")
+
+
+def user_flow(s: Session, meal_type: str, payload: bytes, submit_barrier: threading.Barrier):
+    # 1) 로그인 → 2) 식단표 선택 → 3) 시작 → 4) 업로드(검증) → 5) 동시에 제출
+    try:
+        s.login()
+        if meal_type != "식단표A":
+            _find(s.at.radio, "식단표 유형").set_value(meal_type)
+            s.run("select_meal")
+        _find(s.at.button, "🍽️ 식단 설계 시작").click()
+        s.run("start")
+        s.at.file_uploader[0].set_value((f"{s.username}_{meal_type}.xlsx", payload, XLSX_MIME))
+        s.run("upload_validate")
+        button = _find(s.at.button, "📤 제출하기")
+        if button.disabled:
+            s.errors.append(f"{s.name}: 업로드 검증 실패로 제출 버튼이 비활성화됨")
+            return
+        submit_barrier.wait()
+        button.click()
+        s.run("submit")
+    except threading.BrokenBarrierError:
+        s.errors.append(f"{s.name}: 다른 세션 실패로 동시 제출을 건너뜀")
+    except Exception as e:  # 타임아웃·위젯 없음 등 → 나머지 세션이 제출 대기에서 멈추지 않게
+        s.errors.append(f"{s.name}: {type(e).__name__}: {e}")
+        submit_barrier.abort()
+
+
+def admin_flow(s: Session, users_done: threading.Event, interval: float):
+    # 사용자 세션이 끝날 때까지 대시보드 다시 그리기
+    try:
+        s.login()
+        while not users_done.is_set():
+            s.run("admin_rerun")
+            users_done.wait(interval)
+    except Exception as e:
+        s.errors.append(f"{s.name}: {type(e).__name__}: {e}")
+
+
+def _wait_for_submissions(expected: int, timeout: float) -> int:
+    # 백그라운드 제출 큐가 expected 건을 처리할 때까지 대기 (submit.process span 개수)
+    from perf_spans import PROCESS_SPANS
+
+    deadline = time.monotonic() + timeout
+    while PROCESS_SPANS.count("submit.process") < expected and time.monotonic() < deadline:
+        time.sleep(0.1)
+    return PROCESS_SPANS.count("submit.process")
+
+
+def _check_contention(submitted: int, processed: int, fake,
+                      log_wait_limit_ms: float = LOG_CSV_WAIT_MS) -> tuple[dict, list[str]]:
+    """log.csv / uploads/ / Supabase 결과를 제출 수와 맞춰 봅니다."""
+    import pandas as pd
+    from perf_spans import PROCESS_SPANS
+
+    issues = []
+    log_rows = len(pd.read_csv("log.csv")) if os.path.exists("log.csv") else 0
+    backups = [f for f in os.listdir("uploads") if f.endswith(".xlsx")]
+    spans = PROCESS_SPANS.to_frame().set_index("구간")
+    log_wait = float(spans.loc["submit.log_csv", "p95(ms)"]) if "submit.log_csv" in spans.index else 0.0
+    checks = {
+        "submitted": submitted,
+        "processed": processed,
+        "log_csv_rows": log_rows,
+        "log_csv_p95_ms": log_wait,
+        "backup_files": len(backups),
+        "db_rows": len(fake.state.rows) if fake else None,
+        "storage_objects": len(fake.state.objects) if fake else None,
+    }
+    if processed < submitted:
+        issues.append(f"제출 처리 미완료: {processed}/{submitted}")
+    if log_rows != processed:
+        issues.append(f"log.csv 행 수 불일치: {log_rows}행 / 처리 {processed}건 (동시 추가 중 누락·중복)")
+    if log_wait > log_wait_limit_ms:
+        issues.append(f"log.csv 잠금 경합: submit.log_csv p95 {log_wait}ms > {log_wait_limit_ms}ms")
+    if len(backups) < submitted:
+        issues.append(f"uploads/ 백업 파일명 충돌: 제출 {submitted}건에 백업 {len(backups)}개 "
+                      "(백업이 덮어써졌거나 저장되지 않음)")
+    return checks, issues
+
+
+def run(scale: int, latency_ms: float, offline: bool, same_file: bool, admin_interval: float,
+        wait_seconds: float, log_wait_limit_ms: float = LOG_CSV_WAIT_MS) -> dict:
+    with FakeSupabase(latency=latency_ms / 1000) as fake:
+        workdir = _prepare_workdir(OFFLINE_URL if offline else fake.url)
+        for name in ASSETS:
+            src = os.path.join(REPO_DIR, name)
+            if os.path.exists(src):
+                os.symlink(src, os.path.join(workdir, name))
+        os.chdir(workdir)
+        sys.path.insert(0, REPO_DIR)
+        from streamlit import logger
+        logger.set_log_level("error")
+
+        _pin_runtime()
+        from perf_spans import PROCESS_SPANS
+        PROCESS_SPANS.reset()
+
+        meal_types = ["식단표A", "식단표B"]
+        users = [Session(u, p, k) for k in range(scale) for u, p in USERS]
+        admins = [Session(*ADMIN, k) for k in range(scale)]
+        plan = [(s, meal_types[i % 2]) for i, s in enumerate(users)]  # 세션마다 A/B 번갈아
+        payloads = [_submission_file(meal_type, s.name, same_file) for s, meal_type in plan]
+
+        rss_before = _rss_bytes()
+        barrier = threading.Barrier(len(users))
+        users_done = threading.Event()
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=len(users) + len(admins)) as pool:
+            admin_futures = [pool.submit(admin_flow, s, users_done, admin_interval) for s in admins]
+            user_futures = [pool.submit(user_flow, s, meal_type, payload, barrier)
+                            for (s, meal_type), payload in zip(plan, payloads)]
+            for f in user_futures:
+                f.result()
+            users_done.set()
+            for f in admin_futures:
+                f.result()
+        wall = time.perf_counter() - start
+        rss_after = _rss_bytes()
+
+        submitted = sum(1 for s in users if any(step == "submit" for step, _ in s.timings))
+        processed = _wait_for_submissions(submitted, wait_seconds)
+        checks, issues = _check_contention(submitted, processed, None if offline else fake, log_wait_limit_ms)
+
+    sessions = users + admins
+    steps: dict[str, list[float]] = {}
+    for s in sessions:
+        for step, ms in s.timings:
+            steps.setdefault(step, []).append(ms)
+    errors = [e for s in sessions for e in s.errors]
+    return {
+        "sessions": len(sessions),
+        "wall_s": round(wall, 2),
+        "rss_per_session_mb": round((rss_after - rss_before) / len(sessions) / 2**20, 2),
+        "rss_total_mb": round(rss_after / 2**20, 1),
+        "steps": [{
+            "step": step,
+            "n": len(ms),
+            "p50_ms": round(percentile(ms, 0.50), 1),
+            "p95_ms": round(percentile(ms, 0.95), 1),
+            "max_ms": round(max(ms), 1),
+        } for step, ms in steps.items()],
+        "spans": PROCESS_SPANS.to_frame().to_dict("records"),
+        "checks": checks,
+        "issues": issues + errors,
+    }
+
+
+def print_report(result: dict):
+    print(f"세션 {result['sessions']}개 · 소요 {result['wall_s']}s · "
+          f"세션당 메모리 +{result['rss_per_session_mb']}MB (전체 RSS {result['rss_total_mb']}MB)\n")
+    header = f"{'step':<18}{'n':>6}{'p50 ms':>10}{'p95 ms':>10}{'max ms':>10}"
+    print(header)
+    print("-" * len(header))
+    for r in result["steps"]:
+        print(f"{r['step']:<18}{r['n']:>6}{r['p50_ms']:>10}{r['p95_ms']:>10}{r['max_ms']:>10}")
+    print("\nspan")
+    for r in result["spans"]:
+        print(f"  {r['구간']:<26}{r['횟수']:>6}  p50 {r['p50(ms)']}ms  p95 {r['p95(ms)']}ms  최대 {r['최대(ms)']}ms")
+    print("\n공유 자원 점검")
+    for key, value in result["checks"].items():
+        print(f"  {key:<18}{value}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="SR01–SR13 + admin 동시 세션 부하 테스트 (AppTest)")
+    parser.add_argument("--scale", type=int, default=1, help="계정당 동시 세션 수 (N배)")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="가짜 Supabase 요청당 지연 (ms)")
+    parser.add_argument("--offline", action="store_true", help="Supabase 연결 불가 상태로 실행")
+    parser.add_argument("--same-file", action="store_true", help="모든 세션이 같은 파일 제출 (내용 중복 제거 경로)")
+    parser.add_argument("--admin-interval", type=float, default=0.5, help="admin 리런 간격 (초)")
+    parser.add_argument("--wait", type=float, default=60.0, help="백그라운드 제출 처리 대기 한도 (초)")
+    parser.add_argument("--log-wait-ms", type=float, default=LOG_CSV_WAIT_MS,
+                        help=f"log.csv 잠금 대기 한도: submit.log_csv p95 (기본 {LOG_CSV_WAIT_MS:g}ms)")
+    parser.add_argument("--json", help="결과를 JSON 으로 저장")
+    args = parser.parse_args(argv)
+
+    cwd = os.getcwd()
+    result = run(args.scale, args.latency_ms, args.offline, args.same_file, args.admin_interval, args.wait,
+                 args.log_wait_ms)
+    os.chdir(cwd)
+    print_report(result)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2, default=str)
+    if result["issues"]:
+        print("\n❌ 문제 발견:")
+        for line in result["issues"]:
+            print("  " + line)
+        return 1
+    print("\n✅ 경합/오류 없음")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
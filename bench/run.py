@@ -0,0 +1,182 @@
+"""
+제출/관리자 경로 벤치마크
+
+    python -m bench.run                                  # 기본: 1k/10k/100k 행, 지연 2ms
+    python -m bench.run --rows 1000 10000 --latency-ms 20 --iterations 30
+    python -m bench.run --json bench_result.json         # 결과 저장
+    python -m bench.run --baseline bench_result.json     # 기준 대비 p50 이 tolerance 이상 느려지면 종료 코드 1
+
+- 프로세스 안 가짜 Supabase(bench/fake_supabase.py)를 띄우고, 임시 작업 폴더의
+  .streamlit/secrets.toml 로 앱 코드(supabase_helpers 등)가 그 서버를 보게 합니다.
+- 각 항목의 처리량(ops/s)과 p50/p99 지연(ms)을 출력합니다.
+"""
+import argparse
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from bench.fake_supabase import FakeSupabase
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SERVICE_KEY = "x.eyJyb2xlIjoic2VydmljZV9yb2xlIn0.y"  # {"role": "service_role"}
+BUCKET = "bench"
+
+
+def percentile(samples: list[float], q: float) -> float:
+    s = sorted(samples)
+    return s[min(len(s) - 1, max(0, round(q * (len(s) - 1))))] if s else 0.0
+
+
+def measure(name: str, fn, iterations: int, rows: int | None = None, warmup: int = 1) -> dict:
+    """fn(i) 를 iterations 번 호출해 지연 분포를 잽니다 (warmup 회는 제외)."""
+    for i in range(warmup):
+        fn(-1 - i)
+    samples = []
+    start = time.perf_counter()
+    for i in range(iterations):
+        t = time.perf_counter()
+        fn(i)
+        samples.append((time.perf_counter() - t) * 1000)
+    wall = time.perf_counter() - start
+    return {
+        "case": name,
+        "rows": rows,
+        "n": iterations,
+        "ops_per_s": round(iterations / wall, 1) if wall else 0.0,
+        "p50_ms": round(percentile(samples, 0.50), 3),
+        "p99_ms": round(percentile(samples, 0.99), 3),
+        "mean_ms": round(sum(samples) / len(samples), 3),
+    }
+
+
+def _prepare_workdir(url: str) -> str:
+    # 앱 코드는 st.secrets 와 상대 경로(log.csv 등)를 쓰므로 임시 폴더에서 실행
+    workdir = tempfile.mkdtemp(prefix="bench_")
+    os.makedirs(os.path.join(workdir, ".streamlit"))
+    with open(os.path.join(workdir, ".streamlit", "secrets.toml"), "w", encoding="utf-8") as f:
+        f.write(f'SUPABASE_URL = "{url}"\nSUPABASE_SERVICE_ROLE_KEY = "{SERVICE_KEY}"\n'
+                f'SUPABASE_BUCKET = "{BUCKET}"\nSUPABASE_CLIENT_VERSION = "bench"\n')
+    # Streamlit 밖(bare mode)에서 캐시 함수를 부를 때 나오는 경고 숨김
+    with open(os.path.join(workdir, ".streamlit", "config.toml"), "w", encoding="utf-8") as f:
+        f.write('[logger]\nlevel = "error"\n')
+    return workdir
+
+
+def run(rows_list, latency_ms: float, iterations: int, file_kb: int) -> list[dict]:
+    results = []
+    with FakeSupabase(latency=latency_ms / 1000) as fake:
+        os.chdir(_prepare_workdir(fake.url))
+        sys.path.insert(0, REPO_DIR)
+        from streamlit import logger
+        logger.set_log_level("error")  # config.toml 을 읽기 전(모듈 import 시점) 경고도 숨김
+
+        import supabase_helpers as sh
+        from menu_catalog import catalog_to_json, clear_catalog_cache, find_menu_xlsx, load_menu_catalog
+        from menu_component import get_catalog_json_cache
+        from submission_log import append_log_row
+
+        sb = sh.get_supabase()
+        if sb is None:
+            raise SystemExit("Supabase 대역에 연결하지 못했습니다")
+        payload = b"PK" + os.urandom(file_kb * 1024)
+        now = datetime(2030, 1, 1, 9, 0, 0)
+
+        # 1) 제출 경로 (테이블 크기와 무관)
+        results.append(measure("upload_to_storage", lambda i: sh.upload_to_storage(
+            payload, "SR01", "식단표A", sb=sb, storage_path=f"bench/{i}.xlsx"), iterations))
+        tus = sh.get_tus_uploader(version="bench")
+        results.append(measure("upload_resumable(tus)", lambda i: sh.upload_to_storage_resumable(
+            io.BytesIO(payload), len(payload), f"bench/tus/{i}.xlsx", tus), iterations))
+        results.append(measure("insert_row_kor", lambda i: sh.insert_row_kor(
+            "SR01", now, now + timedelta(seconds=i + 10), 300, "식단표A", f"bench/{i}.xlsx", "bench.xlsx",
+            sb=sb), iterations))
+        log_row = {"사용자": "SR01", "시작시간": "2030-01-01 09:00:00", "제출시간": "2030-01-01 09:05:00",
+                   "소요시간(초)": 300, "식단표종류": "식단표A", "파일경로": "bench/x.xlsx"}
+        results.append(measure("log_csv_append", lambda i: append_log_row("log.csv", log_row), iterations))
+        results.append(measure("make_signed_url(cold)", lambda i: sh.make_signed_url(
+            f"cold/{i}.xlsx"), iterations))
+        results.append(measure("make_signed_url(warm)", lambda i: sh.make_signed_url("warm.xlsx"), iterations))
+
+        # 2) 메뉴 카탈로그(JSON) 조립 — 기존 메뉴 HTML 조립 경로
+        sig = find_menu_xlsx([os.path.join(REPO_DIR, "menu.xlsx")])
+        if sig:
+            def catalog_cold(i):
+                clear_catalog_cache()
+                catalog_to_json(load_menu_catalog(xlsx_sig=sig))
+            cache = get_catalog_json_cache()
+            results.append(measure("menu_catalog_json(cold)", catalog_cold, max(3, iterations // 10)))
+            results.append(measure("menu_catalog_json(warm)", lambda i: cache.get_or_build(
+                sig, lambda: catalog_to_json(load_menu_catalog(xlsx_sig=sig))), iterations))
+
+        # 3) 관리자 조회 (테이블 크기별)
+        for n in rows_list:
+            fake.state.seed_submissions(n)
+            snapshot = sh.get_logs_snapshot(sh.DEFAULT_PAGE_SIZE, sh.client_version())
+
+            def logs_cold(i):
+                snapshot.reset()
+                df = sh.fetch_logs_df()
+                assert len(df) == n, (len(df), n)
+            results.append(measure("fetch_logs_df(full)", logs_cold, max(3, iterations // 10), rows=n))
+            results.append(measure("fetch_logs_df(incremental)", lambda i: sh.fetch_logs_df(), iterations, rows=n))
+    return results
+
+
+def print_table(results: list[dict]):
+    header = f"{'case':<28}{'rows':>8}{'n':>6}{'ops/s':>10}{'p50 ms':>10}{'p99 ms':>10}{'mean ms':>10}"
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        print(f"{r['case']:<28}{r['rows'] if r['rows'] is not None else '-':>8}{r['n']:>6}"
+              f"{r['ops_per_s']:>10}{r['p50_ms']:>10}{r['p99_ms']:>10}{r['mean_ms']:>10}")
+
+
+def compare(results: list[dict], baseline: list[dict], tolerance: float) -> list[str]:
+    """기준보다 p50 이 (1 + tolerance) 배 넘게 느려진 항목."""
+    base = {(b["case"], b["rows"]): b for b in baseline}
+    regressions = []
+    for r in results:
+        b = base.get((r["case"], r["rows"]))
+        if b and b["p50_ms"] > 0 and r["p50_ms"] > b["p50_ms"] * (1 + tolerance):
+            regressions.append(f"{r['case']} rows={r['rows']}: p50 {b['p50_ms']}ms → {r['p50_ms']}ms")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="submit/admin 경로 벤치마크 (가짜 Supabase)")
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 10000, 100000],
+                        help="submissions 테이블 크기 (여러 개 가능)")
+    parser.add_argument("--latency-ms", type=float, default=2.0, help="요청당 지연 (ms)")
+    parser.add_argument("--iterations", type=int, default=50, help="항목별 반복 횟수")
+    parser.add_argument("--file-kb", type=int, default=200, help="업로드 파일 크기 (KB)")
+    parser.add_argument("--json", help="결과를 JSON 으로 저장")
+    parser.add_argument("--baseline", help="비교할 이전 결과 JSON")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="허용 p50 증가 비율 (기본 25%%)")
+    args = parser.parse_args(argv)
+
+    cwd = os.getcwd()
+    results = run(args.rows, args.latency_ms, args.iterations, args.file_kb)
+    os.chdir(cwd)
+    print_table(results)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"latency_ms": args.latency_ms, "results": results}, f, ensure_ascii=False, indent=2)
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = compare(results, json.load(f)["results"], args.tolerance)
+        if regressions:
+            print("\n❌ 성능 저하:")
+            for line in regressions:
+                print("  " + line)
+            return 1
+        print("\n✅ 기준 대비 성능 저하 없음")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
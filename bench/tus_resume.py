@@ -0,0 +1,92 @@
+"""
+재개 가능(TUS) 업로드 시나리오 점검
+
+    python -m bench.tus_resume               # 기본: 1MB 파일, 128KB 청크
+    python -m bench.tus_resume --size-kb 4096 --chunk-kb 512
+
+가짜 Supabase(bench/fake_supabase.py)의 TUS 경로에 대해 다음을 확인합니다.
+1) 청크 전송 도중 연결이 끊기면 같은 호출 안에서 HEAD 로 오프셋을 확인하고 이어서 보냄
+2) 재시도를 모두 실패해 예외가 나도, 같은 경로로 다시 호출하면 남은 부분만 보냄
+3) 서버에서 업로드가 만료(404)되면 새로 만들어 처음부터 보냄
+각 시나리오마다 서버에 저장된 객체가 원본과 같은지 비교하고, 하나라도 틀리면 종료 코드 1.
+"""
+import argparse
+import io
+import os
+import sys
+
+from bench.fake_supabase import FakeSupabase
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BUCKET = "bench"
+
+
+def _stored(fake, name: str) -> bytes | None:
+    with fake.state.lock:
+        return fake.state.objects.get((BUCKET, name))
+
+
+def run(size_kb: int, chunk_kb: int) -> list[tuple[str, bool, str]]:
+    sys.path.insert(0, REPO_DIR)
+    from tus_upload import TusUploader
+
+    payload = b"PK" + os.urandom(size_kb * 1024 - 2)
+    size = len(payload)
+    chunks = -(-size // (chunk_kb * 1024))
+    results = []
+    with FakeSupabase(latency=0) as fake:
+        def uploader(max_retries: int) -> TusUploader:
+            return TusUploader(fake.url, "bench-key", chunk_size=chunk_kb * 1024, max_retries=max_retries)
+
+        # 1) 한 번 끊긴 뒤 같은 호출 안에서 재개
+        tus = uploader(max_retries=3)
+        fake.state.fail_next_patches(1, after=chunks // 2)
+        sent = tus.upload(io.BytesIO(payload), size, BUCKET, "resume/inline.xlsx")
+        # 끊긴 청크 중 서버가 받은 절반은 다시 보내지 않음 (응답이 없었으니 sent 에서도 빠짐)
+        ok = (_stored(fake, "resume/inline.xlsx") == payload and sent == size - chunk_kb * 1024 // 2
+              and tus.pending() == 0)
+        results.append(("끊긴 청크 이어서 전송", ok, f"sent={sent}/{size}, patches={fake.state.tus_patches}"))
+
+        # 2) 절반쯤에서 끊기고 재시도도 없음 → 예외, 다음 호출에서 남은 부분만 전송
+        tus = uploader(max_retries=0)
+        fake.state.fail_next_patches(1, after=chunks // 2)
+        try:
+            tus.upload(io.BytesIO(payload), size, BUCKET, "resume/retry.xlsx")
+            failed = False
+        except Exception:
+            failed = True
+        pending = tus.pending()
+        sent = tus.upload(io.BytesIO(payload), size, BUCKET, "resume/retry.xlsx")
+        ok = (failed and pending == 1 and 0 < sent < size
+              and _stored(fake, "resume/retry.xlsx") == payload and tus.pending() == 0)
+        results.append(("실패 후 다음 호출에서 재개", ok, f"failed={failed}, resumed sent={sent}/{size}"))
+
+        # 3) 서버 쪽 업로드 만료 → 재생성 후 처음부터
+        tus = uploader(max_retries=0)
+        fake.state.fail_next_patches(1, after=1)
+        try:
+            tus.upload(io.BytesIO(payload), size, BUCKET, "resume/expired.xlsx")
+        except Exception:
+            pass
+        tus.max_retries = 3
+        fake.state.expire_uploads()
+        sent = tus.upload(io.BytesIO(payload), size, BUCKET, "resume/expired.xlsx")
+        ok = sent == size and _stored(fake, "resume/expired.xlsx") == payload and tus.pending() == 0
+        results.append(("만료(404) 후 재생성", ok, f"sent={sent}/{size}"))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="TUS 업로드 중단/재개 시나리오 (가짜 Supabase)")
+    parser.add_argument("--size-kb", type=int, default=1024, help="업로드 파일 크기 (KB)")
+    parser.add_argument("--chunk-kb", type=int, default=128, help="청크 크기 (KB)")
+    args = parser.parse_args(argv)
+
+    results = run(args.size_kb, args.chunk_kb)
+    for name, ok, detail in results:
+        print(f"{'✅' if ok else '❌'} {name}: {detail}")
+    return 0 if all(ok for _, ok, _ in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,217 @@
+"""
+제출 파일 내용 주소(SHA-256) 저장소
+
+- 업로드 파일을 청크로 복사하면서 SHA-256 을 계산합니다 (전체 bytes 복사본 없음).
+- 내용은 uploads/blobs/{해시 앞 2자리}/{해시}.xlsx 에 한 번만 저장합니다 (같은 내용이면 재사용).
+- 제출별 로컬 백업 uploads/{사용자}_{식단표}_{제출시각}[-n].xlsx 은 blob 의 하드링크 → 이력이 덮어써지지 않고
+  같은 파일을 여러 번 제출해도 디스크는 한 번만 씁니다 (하드링크가 안 되는 환경은 복사).
+- Storage 객체 경로도 내용 해시(blobs/ab/abcd….xlsx)라서, 이미 올라간 내용이면 업로드를 건너뜁니다.
+- BackupIndex: 제출별 백업 목록(사용자 → 최신순, 크기 포함). 폴더는 처음 한 번만 훑고
+  이후에는 제출마다 add() 로 한 건씩 반영합니다 (폴더 mtime 이 바뀌면 다시 훑음).
+"""
+import hashlib
+import itertools
+import os
+import shutil
+import tempfile
+import threading
+from dataclasses import dataclass
+
+CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class BlobRef:
+    sha256: str
+    size: int
+    path: str       # 로컬 blob 경로
+    created: bool   # 이번에 새로 저장했는지 (False = 같은 내용이 이미 있음)
+
+
+def storage_object_path(sha256: str, ext: str = ".xlsx") -> str:
+    """내용 해시 → Storage 객체 경로 (버킷명 제외)."""
+    return f"blobs/{sha256[:2]}/{sha256}{ext}"
+
+
+class BlobStore:
+    """로컬 blob 저장소 + 업로드된 Storage 객체 목록 (st.cache_resource 로 프로세스당 1개)."""
+
+    def __init__(self, root: str, ext: str = ".xlsx"):
+        self.root = root
+        self.ext = ext
+        self._tmp_dir = os.path.join(root, "tmp")
+        os.makedirs(self._tmp_dir, exist_ok=True)
+        self._uploaded: set[tuple[str, str]] = set()  # (버킷, 객체 경로) — 이미 올라간 것으로 확인됨
+        self._lock = threading.Lock()
+        self.blobs_written = 0
+        self.local_dedup = 0
+        self.uploads_skipped = 0
+        self.bytes_saved = 0
+
+    def blob_path(self, sha256: str) -> str:
+        return os.path.join(self.root, sha256[:2], sha256 + self.ext)
+
+    def put_stream(self, fileobj) -> BlobRef:
+        """fileobj 를 처음부터 읽어 해시하며 저장합니다. 같은 내용이 있으면 그 blob 을 돌려줍니다."""
+        h = hashlib.sha256()
+        size = 0
+        if hasattr(fileobj, "seek"):
+            fileobj.seek(0)
+        fd, tmp_name = tempfile.mkstemp(dir=self._tmp_dir, suffix=self.ext)
+        try:
+            with os.fdopen(fd, "wb") as tmp:
+                for chunk in iter(lambda: fileobj.read(CHUNK_SIZE), b""):
+                    h.update(chunk)
+                    tmp.write(chunk)
+                    size += len(chunk)
+            sha = h.hexdigest()
+            target = self.blob_path(sha)
+            created = not os.path.exists(target)
+            if created:
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                os.chmod(tmp_name, 0o444)  # blob 은 읽기 전용 (하드링크 백업이 같은 inode 공유)
+                os.replace(tmp_name, target)
+        finally:
+            if os.path.exists(tmp_name):
+                os.remove(tmp_name)
+            if hasattr(fileobj, "seek"):
+                fileobj.seek(0)
+        with self._lock:
+            if created:
+                self.blobs_written += 1
+            else:
+                self.local_dedup += 1
+        return BlobRef(sha, size, target, created)
+
+    def link(self, blob: BlobRef, dest: str) -> str:
+        """
+        blob 을 dest 로 하드링크하고 실제 경로를 반환합니다 (하드링크 불가 시 복사).
+        기존 파일은 덮어쓰지 않습니다 — 이미 있으면 이름 뒤에 -2, -3 … 을 붙입니다
+        (같은 사용자·식단표를 같은 초에 두 번 제출해도 백업이 둘 다 남음).
+        """
+        stem, ext = os.path.splitext(dest)
+        for n in itertools.count(1):
+            path = dest if n == 1 else f"{stem}-{n}{ext}"
+            try:
+                os.link(blob.path, path)  # 이미 있으면 FileExistsError (원자적, 덮어쓰지 않음)
+                return path
+            except FileExistsError:
+                continue
+            except OSError:
+                pass
+            # 하드링크 불가 → 이름을 먼저 선점(O_EXCL)한 뒤 복사
+            try:
+                fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL)
+            except FileExistsError:
+                continue
+            with os.fdopen(fd, "wb") as out, open(blob.path, "rb") as src:
+                shutil.copyfileobj(src, out, CHUNK_SIZE)
+            return path
+
+    # --- Storage 중복 업로드 방지 ----------------------------------------
+    def is_uploaded(self, bucket: str, path: str) -> bool:
+        with self._lock:
+            return (bucket, path) in self._uploaded
+
+    def mark_uploaded(self, bucket: str, path: str):
+        with self._lock:
+            self._uploaded.add((bucket, path))
+
+    def record_skip(self, size: int):
+        with self._lock:
+            self.uploads_skipped += 1
+            self.bytes_saved += size
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "blobs_written": self.blobs_written,
+                "local_dedup": self.local_dedup,
+                "uploads_skipped": self.uploads_skipped,
+                "bytes_saved": self.bytes_saved,
+                "known_remote": len(self._uploaded),
+            }
+
+
+@dataclass(frozen=True)
+class BackupFile:
+    path: str
+    name: str
+    size: int
+
+
+class BackupIndex:
+    """
+    uploads/{사용자}{marker}…_{제출시각}.xlsx 백업 목록 (st.cache_resource 로 프로세스당 1개).
+    사용자별로 제출시각 최신순으로 보관해, 사용자를 바꿔도 폴더를 다시 훑지 않습니다.
+    """
+
+    def __init__(self, folder: str, marker: str = "_식단표", ext: str = ".xlsx"):
+        self.folder = folder
+        self.marker = marker
+        self.ext = ext
+        self._by_user: dict[str, list[BackupFile]] = {}
+        self._dir_mtime: int | None = None  # 마지막으로 반영한 폴더 mtime (None = 아직 안 훑음)
+        self._lock = threading.Lock()
+        self.scans = 0
+
+    def _user_of(self, name: str) -> str | None:
+        if not name.endswith(self.ext) or self.marker not in name:
+            return None
+        return name.split(self.marker, 1)[0]
+
+    def _sort_key(self, f: BackupFile):
+        # 파일명 끝의 제출시각(YYYYmmdd-HHMMSS[-n]) 기준, 같은 초면 -n 순서, 시각이 없는 예전 파일명은 맨 뒤
+        stamp = f.name[:-len(self.ext)].rsplit("_", 1)[-1]
+        if not stamp[:1].isdigit():
+            return ("", 0, f.name)
+        day, _, rest = stamp.partition("-")
+        clock, _, n = rest.partition("-")
+        return (f"{day}-{clock}", int(n) if n.isdigit() else 1, f.name)
+
+    def _dir_signature(self) -> int | None:
+        try:
+            return os.stat(self.folder).st_mtime_ns
+        except OSError:
+            return None
+
+    def _scan(self, signature: int | None):
+        by_user: dict[str, list[BackupFile]] = {}
+        try:
+            entries = list(os.scandir(self.folder))
+        except OSError:
+            entries = []
+        for entry in entries:
+            user = self._user_of(entry.name)
+            if user is None or not entry.is_file():
+                continue
+            by_user.setdefault(user, []).append(BackupFile(entry.path, entry.name, entry.stat().st_size))
+        for files in by_user.values():
+            files.sort(key=self._sort_key, reverse=True)
+        self._by_user = by_user
+        self._dir_mtime = signature
+        self.scans += 1
+
+    def files(self, user: str) -> list[BackupFile]:
+        """user 의 백업 파일 (최신순). 폴더가 밖에서 바뀐 경우에만 다시 훑습니다."""
+        signature = self._dir_signature()  # 훑기 전에 읽어야 훑는 도중 바뀐 것도 다음에 반영됨
+        with self._lock:
+            if self._dir_mtime is None or signature != self._dir_mtime:
+                self._scan(signature)
+            return list(self._by_user.get(user, ()))
+
+    def add(self, path: str):
+        """제출 직후 호출 — 방금 만든 백업 한 건만 반영합니다 (같은 이름이면 교체)."""
+        name = os.path.basename(path)
+        user = self._user_of(name)
+        if user is None:
+            return
+        size = os.path.getsize(path)
+        with self._lock:
+            if self._dir_mtime is None:
+                return  # 아직 한 번도 훑지 않음 → 첫 조회 때 함께 읽힘
+            files = [f for f in self._by_user.get(user, []) if f.name != name]
+            files.append(BackupFile(path, name, size))
+            files.sort(key=self._sort_key, reverse=True)
+            self._by_user[user] = files
+            self._dir_mtime = self._dir_signature()
@@ -0,0 +1,80 @@
+"""
+공용 캐시 도우미
+
+- file_signature: (경로, mtime_ns, 크기) — 파일 교체 감지용 캐시 키
+- KeyedCache: 스레드 안전 LRU 캐시 + 적중/미스 카운터
+  (st.cache_resource 로 감싸서 세션/리런 간에 공유해서 씁니다)
+"""
+import os
+import threading
+from collections import OrderedDict
+
+
+def file_signature(path: str) -> tuple[str, int, int] | None:
+    """(경로, mtime_ns, 크기) — 파일이 바뀌면 값이 달라지므로 캐시 키로 사용합니다."""
+    try:
+        stt = os.stat(path)
+    except OSError:
+        return None
+    return (path, stt.st_mtime_ns, stt.st_size)
+
+
+def first_existing_signature(paths) -> tuple[str, int, int] | None:
+    """후보 경로 중 첫 번째로 존재하는 파일의 시그니처 (stat 1회/후보)."""
+    for p in paths:
+        sig = file_signature(p)
+        if sig is not None:
+            return sig
+    return None
+
+
+class KeyedCache:
+    """키 → 값 LRU 캐시. 여러 세션이 동시에 접근해도 안전합니다."""
+
+    def __init__(self, max_entries: int = 8):
+        self.max_entries = max_entries
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.generation = 0  # invalidate() 호출 횟수 (삭제할 항목이 없어도 증가)
+
+    def get_or_build(self, key, builder):
+        """key 가 있으면 캐시 값, 없으면 builder() 결과를 저장 후 반환합니다."""
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+            self.misses += 1
+
+        # 빌드는 락 밖에서 (느린 I/O 가 다른 세션을 막지 않도록)
+        value = builder()
+
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+        return value
+
+    def invalidate(self, predicate=None) -> int:
+        """predicate(key) 가 참인 항목(없으면 전체)을 지우고 삭제 개수를 반환합니다."""
+        with self._lock:
+            keys = [k for k in self._data if predicate is None or predicate(k)]
+            for k in keys:
+                del self._data[k]
+            self.invalidations += len(keys)
+            self.generation += 1
+            return len(keys)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._data),
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+                "generation": self.generation,
+            }
@@ -0,0 +1,133 @@
+"""
+메뉴 카탈로그 (menu.xlsx 서버측 파싱)
+
+- menu.xlsx 를 서버에서 한 번만 파싱하고 (파일 mtime/크기 기준으로 캐시),
+- Menu/Category/음식 분류코드/대분류/중분류/조리법 유형 컬럼을 정규화한 뒤,
+- 컴포넌트로 보낼 컬럼형(사전 인코딩) JSON 페이로드를 만듭니다.
+"""
+import json
+
+import pandas as pd
+import streamlit as st
+
+from cache_utils import first_existing_signature
+
+# 엑셀 헤더 → 컴포넌트(JS)에서 쓰는 키
+MENU_COLUMNS = {
+    "Menu": "menu",
+    "Category": "category",
+    "음식 분류코드": "code",
+    "대분류": "large",
+    "중분류": "middle",
+    "조리법 유형": "cook",
+}
+
+# 사전 인코딩 대상 (값 종류가 적은 컬럼) — menu 는 원문 그대로 보냅니다
+DICT_KEYS = ["category", "code", "large", "middle", "cook"]
+# 카테고리 안에서 계단식 드롭다운으로 고르는 컬럼 (조합표 순서)
+FACET_KEYS = ["code", "large", "middle", "cook"]
+
+DEFAULT_XLSX_CANDIDATES = [
+    "menu.xlsx",
+    "/mnt/data/menu.xlsx",
+    "/mnt/data/정선_음식 데이터_간식제외.xlsx",
+]
+
+
+def find_menu_xlsx(xlsx_candidates=None) -> tuple[str, int, int] | None:
+    """후보 경로 중 첫 번째로 존재하는 엑셀의 (경로, mtime_ns, 크기)를 반환합니다(없으면 None)."""
+    if xlsx_candidates is None:
+        xlsx_candidates = DEFAULT_XLSX_CANDIDATES
+    return first_existing_signature(xlsx_candidates)
+
+
+def normalize_menu_df(df: pd.DataFrame) -> pd.DataFrame:
+    """엑셀 원본을 menu/category/code/large/middle/cook 6개 컬럼으로 정규화합니다."""
+    out = pd.DataFrame(index=df.index)
+    for src, key in MENU_COLUMNS.items():
+        if src in df.columns:
+            out[key] = df[src].fillna("").astype(str).str.strip()
+        else:
+            out[key] = ""
+    # 메뉴명이 비어 있는 행은 제외 (기존 JS hydrateData 와 동일)
+    out = out[out["menu"] != ""]
+    return out.reset_index(drop=True)
+
+
+def build_catalog_payload(df: pd.DataFrame) -> dict:
+    """
+    정규화된 DataFrame → 컬럼형 페이로드
+
+    {"n": 행 수,
+     "menu": [메뉴명, ...],
+     "dict": {"category": [고유값, ...], ...},
+     "idx":  {"category": [고유값 인덱스, ...], ...},
+     "facets": {카테고리: [[code, large, middle, cook 인덱스..., 행 수], ...]}}
+    """
+    payload = {"n": int(len(df)), "menu": df["menu"].tolist(), "dict": {}, "idx": {}}
+    for key in DICT_KEYS:
+        codes, uniques = pd.factorize(df[key], sort=False)
+        payload["dict"][key] = [str(u) for u in uniques]
+        payload["idx"][key] = codes.tolist()
+    payload["facets"] = build_facet_table(payload)
+    return payload
+
+
+def build_facet_table(payload: dict) -> dict:
+    """
+    카테고리별 (code, large, middle, cook) 조합과 행 수
+    → 드롭다운 허용값/개수는 행 전체가 아니라 이 작은 조합표에서 계산합니다.
+    """
+    codes = pd.DataFrame({key: payload["idx"][key] for key in ["category", *FACET_KEYS]})
+    if codes.empty:
+        return {}
+    sizes = codes.groupby(["category", *FACET_KEYS], sort=True).size()
+    facets: dict[str, list[list[int]]] = {}
+    for (cat, *combo), count in sizes.items():
+        facets.setdefault(payload["dict"]["category"][cat], []).append([*map(int, combo), int(count)])
+    return facets
+
+
+def catalog_row(payload: dict, i: int) -> dict:
+    """페이로드의 i 번째 행을 {menu, category, code, large, middle, cook} 로 복원합니다."""
+    row = {"menu": payload["menu"][i]}
+    for key in DICT_KEYS:
+        row[key] = payload["dict"][key][payload["idx"][key][i]]
+    return row
+
+
+@st.cache_data(show_spinner=False)
+def _load_catalog_cached(path: str, mtime_ns: int, size: int) -> dict:
+    # mtime_ns/size 는 캐시 키 용도 (파일이 교체되면 자동으로 다시 파싱)
+    raw = pd.read_excel(path, sheet_name=0, dtype=str)
+    return build_catalog_payload(normalize_menu_df(raw))
+
+
+def load_menu_catalog(xlsx_candidates=None, xlsx_sig=None) -> dict | None:
+    """
+    존재하는 menu.xlsx 를 찾아 파싱된 카탈로그 페이로드를 반환합니다.
+    파일이 없거나 파싱에 실패하면 None (컴포넌트가 fetch 경로로 폴백).
+
+    - xlsx_sig 를 주면 후보 탐색을 건너뜁니다(이미 stat 한 경우).
+    """
+    sig = xlsx_sig or find_menu_xlsx(xlsx_candidates)
+    if sig is None:
+        return None
+    try:
+        return _load_catalog_cached(*sig)
+    except Exception:
+        return None
+
+
+def clear_catalog_cache():
+    """파싱 결과 캐시를 비웁니다 (메뉴 파일을 같은 mtime 으로 교체한 경우 등)."""
+    _load_catalog_cached.clear()
+
+
+def catalog_to_json(payload: dict | None) -> str:
+    """<script> 안에 그대로 넣을 수 있는 압축 JSON 문자열."""
+    if payload is None:
+        return "null"
+    s = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+    # </script> 조기 종료 방지
+    return s.replace("</", "<\\/")
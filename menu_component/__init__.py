@@ -0,0 +1,80 @@
+"""
+메뉴 관리 커스텀 컴포넌트 (양방향)
+
+- 프론트엔드는 frontend/ 한 곳에만 있습니다 (index.html + engine.js).
+- iframe 은 리런 사이에도 그대로 유지되고, 매 리런마다 보내는 인자는 카탈로그 버전/자산 위치뿐입니다.
+- 카탈로그(JSON)는 컴포넌트가 그 버전을 아직 갖고 있지 않을 때만 보냅니다.
+  컴포넌트는 적재를 마치면 {"catalog_version": ..., "rows": ...} 를 값으로 돌려주고,
+  이후 리런에서는 카탈로그를 생략합니다.
+"""
+import hashlib
+
+import streamlit as st
+import streamlit.components.v1 as components
+
+from cache_utils import KeyedCache
+from menu_catalog import catalog_to_json, clear_catalog_cache, find_menu_xlsx, load_menu_catalog
+from menu_search import clear_search_cache
+from static_assets import COMPONENT_DIR, component_assets
+
+_component = components.declare_component("menu_manager", path=COMPONENT_DIR)
+
+
+@st.cache_resource
+def get_catalog_json_cache() -> KeyedCache:
+    # 직렬화된 카탈로그 JSON 캐시 (모든 세션 공유, 엑셀 시그니처 키)
+    return KeyedCache(max_entries=4)
+
+
+def catalog_version(xlsx_sig) -> str | None:
+    """
+    엑셀 시그니처 + 캐시 무효화 세대 → 짧은 버전 문자열
+    (새로고침 버튼으로 캐시를 비우면 같은 파일이어도 버전이 바뀌어 컴포넌트가 다시 받습니다)
+    """
+    if xlsx_sig is None:
+        return None
+    generation = get_catalog_json_cache().stats()["generation"]
+    return hashlib.sha256(repr((xlsx_sig, generation)).encode("utf-8")).hexdigest()[:12]
+
+
+def invalidate_catalog_cache(xlsx_path: str | None = None) -> int:
+    """
+    카탈로그 JSON 캐시를 비웁니다.
+    - xlsx_path 를 주면 해당 엑셀로 만든 항목만 삭제 (메뉴 파일 교체 시)
+    - 파싱된 카탈로그/검색 인덱스 캐시도 함께 비웁니다.
+    """
+    clear_catalog_cache()
+    clear_search_cache()
+    if xlsx_path is None:
+        return get_catalog_json_cache().invalidate()
+    return get_catalog_json_cache().invalidate(lambda k: k[0] == xlsx_path)
+
+
+def menu_manager(xlsx_candidates=None, height: int = 900, key: str = "menu_manager"):
+    """
+    메뉴 관리 화면을 그립니다.
+    반환값: 컴포넌트가 보고한 값 ({"catalog_version", "rows", "error"}) — 첫 적재 전에는 None
+    """
+    xlsx_sig = find_menu_xlsx(xlsx_candidates)
+    version = catalog_version(xlsx_sig)
+
+    # 컴포넌트가 이미 이 버전을 가지고 있으면 카탈로그는 보내지 않음 (버전만)
+    reported = st.session_state.get(key)
+    have = reported.get("catalog_version") if isinstance(reported, dict) else None
+    catalog = None
+    if version is not None and have != version:
+        catalog = get_catalog_json_cache().get_or_build(
+            xlsx_sig, lambda: catalog_to_json(load_menu_catalog(xlsx_sig=xlsx_sig))
+        )
+        if catalog == "null":
+            # 파싱 실패 → 컴포넌트의 XLSX 폴백 경로
+            version, catalog = None, None
+
+    return _component(
+        catalog_version=version,
+        catalog=catalog,
+        assets=component_assets(),
+        height=height,
+        key=key,
+        default=None,
+    )
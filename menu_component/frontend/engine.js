@@ -0,0 +1,285 @@
+// 메뉴 엔진: 카탈로그 파싱 / 필터·검색 인덱스 / 필터 계산
+// index.html 이 Web Worker 로 실행합니다 (워커를 쓸 수 없으면 같은 파일을 메인 스레드에서 <script> 로 사용).
+const FACET_KEYS = ['category', 'code', 'large', 'middle', 'cook'];
+// 카테고리 안의 계단식 드롭다운 컬럼 (조합표 순서, menu_catalog.FACET_KEYS 와 동일)
+const SELECT_KEYS = ['code', 'large', 'middle', 'cook'];
+// 엑셀 헤더 → 키 (menu_catalog.MENU_COLUMNS 와 동일)
+const MENU_COLUMNS = {
+  'Menu': 'menu', 'Category': 'category', '음식 분류코드': 'code',
+  '대분류': 'large', '중분류': 'middle', '조리법 유형': 'cook'
+};
+
+/* ---------- 카탈로그: {n, menu:[...], dict:{key:[고유값]}, idx:{key:Int32Array}, facets} ---------- */
+function catalogFromJson(text) {
+  const cat = JSON.parse(text);
+  for (const k of FACET_KEYS) cat.idx[k] = Int32Array.from(cat.idx[k]);
+  if (!cat.facets) cat.facets = buildFacetTable(cat);
+  return cat;
+}
+
+function buildFacetTable(cat) {
+  // 서버 build_facet_table 과 같은 형태: {카테고리: [[code, large, middle, cook 인덱스, 행 수], ...]}
+  const groups = new Map();
+  for (let i = 0; i < cat.n; i++) {
+    const combo = [cat.idx.category[i], ...SELECT_KEYS.map(k => cat.idx[k][i])];
+    const key = combo.join(',');
+    const g = groups.get(key);
+    if (g) g[g.length - 1]++; else groups.set(key, [...combo, 1]);
+  }
+  const facets = {};
+  for (const [c, ...rest] of groups.values()) (facets[cat.dict.category[c]] ||= []).push(rest);
+  return facets;
+}
+
+function catalogFromSheetRows(data) {
+  // SheetJS sheet_to_json 결과 → 정규화 + 사전 인코딩 (서버 build_catalog_payload 와 같은 형태)
+  const rows = data.map(r => {
+    const out = {};
+    for (const [src, key] of Object.entries(MENU_COLUMNS)) out[key] = (r[src] ?? '').toString().trim();
+    return out;
+  }).filter(x => x.menu);
+  const cat = { n: rows.length, menu: rows.map(r => r.menu), dict: {}, idx: {} };
+  for (const k of FACET_KEYS) {
+    const seen = new Map();
+    cat.dict[k] = [];
+    cat.idx[k] = new Int32Array(rows.length);
+    rows.forEach((r, i) => {
+      if (!seen.has(r[k])) { seen.set(r[k], cat.dict[k].length); cat.dict[k].push(r[k]); }
+      cat.idx[k][i] = seen.get(r[k]);
+    });
+  }
+  cat.facets = buildFacetTable(cat);
+  return cat;
+}
+
+/* ---------- 필터 인덱스: 값 → 행 비트셋, 조건은 비트 AND 로 교집합 ---------- */
+function buildMenuIndex(cat) {
+  // 컬럼별: 고유값(가나다순) / 행 → 값 번호 / 값 → 행 비트셋 / 고유값 ↔ 사전 인덱스
+  const n = cat.n, words = (n + 31) >>> 5;
+  const facets = {};
+  for (const key of FACET_KEYS) {
+    const dict = cat.dict[key], idx = cat.idx[key];
+    const values = dict.filter(Boolean).sort((a, b) => a.localeCompare(b, 'ko'));
+    const id = new Map(values.map((v, i) => [v, i]));
+    const remap = Int32Array.from(dict, v => id.has(v) ? id.get(v) : -1);
+    const valueOf = new Int32Array(n);
+    const bits = values.map(() => new Uint32Array(words));
+    for (let i = 0; i < n; i++) {
+      const v = remap[idx[i]];
+      valueOf[i] = v;
+      if (v >= 0) bits[v][i >>> 5] |= 1 << (i & 31);
+    }
+    const dictId = new Map(dict.map((v, i) => [v, i]));
+    facets[key] = { values, id, valueOf, bits, dictId, dictOf: Int32Array.from(values, v => dictId.get(v)) };
+  }
+  const all = new Uint32Array(words).fill(0xFFFFFFFF);
+  if (n & 31) all[words - 1] = (1 << (n & 31)) - 1;
+  return { n, facets, all, combos: cat.facets || {}, search: buildSearchIndex(cat.menu) };
+}
+
+function maskFor(index, conds, excludeKey) {
+  // 카테고리 + 선택된 드롭다운 조건의 교집합 (excludeKey 조건은 제외)
+  const mask = index.all.slice();
+  for (const key of FACET_KEYS) {
+    if (key === excludeKey || !conds[key]) continue;
+    const v = index.facets[key].id.get(conds[key]);
+    if (v === undefined) { mask.fill(0); break; }
+    const bits = index.facets[key].bits[v];
+    for (let w = 0; w < mask.length; w++) mask[w] &= bits[w];
+  }
+  return mask;
+}
+
+function forEachSet(mask, fn) {
+  // 켜진 비트(행 번호)만 순서대로 방문
+  for (let w = 0; w < mask.length; w++) {
+    let word = mask[w];
+    while (word) {
+      const t = word & -word;
+      fn((w << 5) + (31 - Math.clz32(t)));
+      word ^= t;
+    }
+  }
+}
+
+function facetOptions(index, category, filters) {
+  // 카테고리 조합표에서 드롭다운별 허용값과 행 수 → {key: [[값, 행 수], ...]} (가나다순)
+  // 각 드롭다운은 자기 자신을 제외한 나머지 선택 조건을 만족하는 조합만 합산
+  const combos = index.combos[category] || [];
+  const want = SELECT_KEYS.map(k => !filters[k] ? -1
+    : (index.facets[k].dictId.has(filters[k]) ? index.facets[k].dictId.get(filters[k]) : -2));
+  const options = {};
+  SELECT_KEYS.forEach((key, col) => {
+    const facet = index.facets[key];
+    const counts = new Float64Array(facet.dictId.size);
+    for (const combo of combos) {
+      let ok = true;
+      for (let o = 0; o < SELECT_KEYS.length; o++) {
+        if (o !== col && want[o] !== -1 && combo[o] !== want[o]) { ok = false; break; }
+      }
+      if (ok) counts[combo[col]] += combo[SELECT_KEYS.length];
+    }
+    options[key] = [];
+    facet.dictOf.forEach((d, v) => { if (counts[d] > 0) options[key].push([facet.values[v], counts[d]]); });
+  });
+  return options;
+}
+/* --------------------------------------------------- */
+
+/* ---------- 메뉴명 검색 인덱스 (menu_search.py 와 같은 규칙) ---------- */
+// 1·2-gram 역색인으로 후보만 확인 / 초성 검색(ㄱㅊㅉㄱ → 김치찌개) / 3글자 이상은 오타 허용
+const CHOSEONG = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ';
+const FUZZY_CANDIDATES = 200;
+
+function normalizeKey(s) {
+  return (s || '').toString().toLowerCase().replace(/\s+/g, '');
+}
+
+function toChoseong(s) {
+  let out = '';
+  for (const ch of s) {
+    const c = ch.charCodeAt(0);
+    out += (c >= 0xAC00 && c <= 0xD7A3) ? CHOSEONG[Math.floor((c - 0xAC00) / 588)] : ch;
+  }
+  return out;
+}
+
+function isChoseongQuery(q) {
+  for (const ch of q) if (CHOSEONG.includes(ch)) return true;
+  return false;
+}
+
+function queryGrams(q) {
+  if (q.length === 1) return [q];
+  const g = new Set();
+  for (let i = 0; i + 1 < q.length; i++) g.add(q.substr(i, 2));
+  return Array.from(g);
+}
+
+function buildPostings(keys) {
+  const postings = new Map();
+  keys.forEach((key, i) => {
+    const grams = new Set();
+    for (let j = 0; j < key.length; j++) {
+      grams.add(key[j]);
+      if (j + 1 < key.length) grams.add(key.substr(j, 2));
+    }
+    for (const g of grams) {
+      if (!postings.has(g)) postings.set(g, []);
+      postings.get(g).push(i);
+    }
+  });
+  return postings;
+}
+
+function buildSearchIndex(menus) {
+  const keys = menus.map(normalizeKey);
+  const cho = keys.map(toChoseong);
+  return { keys, cho, postings: buildPostings(keys), choPostings: buildPostings(cho) };
+}
+
+function substringDistance(q, s, maxDist) {
+  // q 와 s 의 부분 문자열 사이 최소 편집 거리 (maxDist 를 넘으면 maxDist + 1)
+  let prev = new Array(s.length + 1).fill(0);
+  for (let i = 1; i <= q.length; i++) {
+    const cur = [i];
+    for (let j = 1; j <= s.length; j++) {
+      cur.push(Math.min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + (q[i - 1] === s[j - 1] ? 0 : 1)));
+    }
+    if (Math.min(...cur) > maxDist) return maxDist + 1;
+    prev = cur;
+  }
+  return Math.min(...prev);
+}
+
+function searchMenus(index, query) {
+  // 순위순 행 번호: 포함(앞부분 일치 → 위치 → 짧은 이름) 다음 오타 허용(거리 → 짧은 이름)
+  let q = normalizeKey(query);
+  if (!q) return [];
+  const cho = isChoseongQuery(q);
+  if (cho) q = toChoseong(q);
+  const keys = cho ? index.cho : index.keys;
+  const postings = cho ? index.choPostings : index.postings;
+
+  const lists = queryGrams(q).map(g => postings.get(g) || []).sort((a, b) => a.length - b.length);
+  let candidates = lists[0];
+  for (const other of lists.slice(1)) {
+    const set = new Set(other);
+    candidates = candidates.filter(i => set.has(i));
+  }
+  const hits = candidates.filter(i => keys[i].includes(q));
+  hits.sort((a, b) => (keys[b].startsWith(q) - keys[a].startsWith(q))
+    || (keys[a].indexOf(q) - keys[b].indexOf(q)) || (keys[a].length - keys[b].length) || (a - b));
+
+  if (!cho && q.length >= 3) {
+    const maxDist = q.length <= 4 ? 1 : 2;
+    const grams = queryGrams(q);
+    const need = Math.max(1, grams.length - 2 * maxDist);
+    const shared = new Map();
+    for (const g of grams) for (const i of (postings.get(g) || [])) shared.set(i, (shared.get(i) || 0) + 1);
+    const found = new Set(hits);
+    const near = [];
+    const ranked = Array.from(shared).filter(([i, n]) => n >= need && !found.has(i))
+      .sort((a, b) => b[1] - a[1]).slice(0, FUZZY_CANDIDATES);
+    for (const [i] of ranked) {
+      const d = substringDistance(q, keys[i], maxDist);
+      if (d <= maxDist) near.push([d, keys[i].length, i]);
+    }
+    near.sort((a, b) => (a[0] - b[0]) || (a[1] - b[1]) || (a[2] - b[2]));
+    for (const [, , i] of near) hits.push(i);
+  }
+  return hits;
+}
+/* --------------------------------------------------- */
+
+/* ---------- 요청 처리 ---------- */
+const menuEngine = {
+  index: null,
+
+  handle(msg) {
+    if (msg.type === 'load') {
+      // 주입된 JSON 문자열 또는 XLSX ArrayBuffer → 카탈로그 + 인덱스
+      let cat;
+      if (msg.json) {
+        cat = catalogFromJson(msg.json);
+      } else {
+        if (typeof XLSX === 'undefined') {
+          // 워커에서만 importScripts — 메인 스레드는 호출 전에 전역 XLSX 를 불러 둬야 함
+          if (typeof importScripts !== 'function') throw new Error('SheetJS (XLSX) is not loaded');
+          importScripts(msg.sheetjsUrl);
+        }
+        const wb = XLSX.read(msg.buffer, { type: 'array' });
+        cat = catalogFromSheetRows(XLSX.utils.sheet_to_json(wb.Sheets[wb.SheetNames[0]], { defval: '' }));
+      }
+      this.index = buildMenuIndex(cat);
+      // 렌더링용으로 카탈로그를 돌려줌 (idx 는 복사 없이 넘김 — 인덱스 생성 후에는 엔진에서 쓰지 않음)
+      return { result: cat, transfer: FACET_KEYS.map(k => cat.idx[k].buffer) };
+    }
+    if (msg.type === 'filter') {
+      // 검색어가 있으면 검색 순위대로, 없으면 원래 순서대로 (둘 다 카테고리/드롭다운 조건 적용)
+      const index = this.index;
+      const conds = { category: msg.category === 'all' ? '' : msg.category, ...msg.filters };
+      const mask = maskFor(index, conds);
+      let ids = [];
+      if (msg.kw) ids = searchMenus(index.search, msg.kw).filter(i => (mask[i >>> 5] >>> (i & 31)) & 1);
+      else forEachSet(mask, i => ids.push(i));
+      ids = Int32Array.from(ids);
+
+      const options = msg.withOptions ? facetOptions(index, msg.category, msg.filters) : null;
+      return { result: { ids, options }, transfer: [ids.buffer] };
+    }
+    throw new Error('unknown request: ' + msg.type);
+  }
+};
+
+// 워커로 실행된 경우: 메시지 → 처리 → 결과 (typed array 는 transfer)
+if (typeof window === 'undefined') {
+  self.onmessage = e => {
+    try {
+      const { result, transfer } = menuEngine.handle(e.data);
+      self.postMessage({ id: e.data.id, result }, transfer || []);
+    } catch (err) {
+      self.postMessage({ id: e.data.id, error: String(err && err.message || err) });
+    }
+  };
+}
@@ -0,0 +1,169 @@
+"""
+메뉴명 검색 인덱스
+
+- 카탈로그를 불러올 때 한 번만 만듭니다 (menu.xlsx mtime/크기 기준 캐시).
+- 글자 1·2-gram 역색인으로 후보 행만 추린 뒤 확인합니다 (매 검색마다 전체 행을 훑지 않음).
+- 초성 검색: "ㄱㅊㅉㄱ" → 김치찌개, "김ㅊ" 처럼 섞어 써도 초성 기준으로 찾습니다.
+- 오타 허용: 일치하는 결과가 부족하면 편집 거리 1~2 이내 메뉴를 뒤에 붙입니다.
+- 메뉴 관리 컴포넌트(JS buildSearchIndex/searchMenus)도 같은 규칙을 따릅니다.
+"""
+from collections import Counter
+
+import streamlit as st
+
+from menu_catalog import catalog_row, find_menu_xlsx, load_menu_catalog
+
+HANGUL_FIRST, HANGUL_LAST = 0xAC00, 0xD7A3
+# 한글 음절 = 초성 19 × 중성 21 × 종성 28 → 초성 번호 = (코드 - 0xAC00) // 588
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+
+DEFAULT_LIMIT = 50
+# 오타 허용 검색에서 편집 거리를 계산할 최대 후보 수 (2-gram 공유가 많은 순)
+FUZZY_CANDIDATES = 200
+
+
+def normalize_key(text) -> str:
+    """소문자 + 공백 제거 ("김치 찌개" 와 "김치찌개" 를 같게 봅니다)."""
+    return "".join(str(text or "").lower().split())
+
+
+def to_choseong(text: str) -> str:
+    """한글 음절을 초성으로 바꿉니다 (그 밖의 글자는 그대로)."""
+    out = []
+    for ch in text:
+        code = ord(ch)
+        if HANGUL_FIRST <= code <= HANGUL_LAST:
+            out.append(CHOSEONG[(code - HANGUL_FIRST) // 588])
+        else:
+            out.append(ch)
+    return "".join(out)
+
+
+def is_choseong_query(query: str) -> bool:
+    return any(ch in CHOSEONG for ch in query)
+
+
+def _grams(s: str) -> set[str]:
+    # 색인용: 1-gram + 2-gram
+    return {s[i] for i in range(len(s))} | {s[i:i + 2] for i in range(len(s) - 1)}
+
+
+def _query_grams(q: str) -> set[str]:
+    # 검색어가 한 글자면 1-gram, 아니면 2-gram 만 (후보가 훨씬 적음)
+    return {q} if len(q) == 1 else {q[i:i + 2] for i in range(len(q) - 1)}
+
+
+def _build_postings(keys: list[str]) -> dict[str, list[int]]:
+    postings: dict[str, list[int]] = {}
+    for i, key in enumerate(keys):
+        for g in _grams(key):
+            postings.setdefault(g, []).append(i)
+    return postings
+
+
+def substring_distance(q: str, s: str, max_dist: int) -> int:
+    """q 와 s 의 부분 문자열 사이 최소 편집 거리 (max_dist 를 넘으면 max_dist + 1)."""
+    prev = [0] * (len(s) + 1)
+    for i in range(1, len(q) + 1):
+        cur = [i]
+        for j in range(1, len(s) + 1):
+            cur.append(min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + (q[i - 1] != s[j - 1])))
+        if min(cur) > max_dist:
+            return max_dist + 1
+        prev = cur
+    return min(prev)
+
+
+class MenuSearchIndex:
+    """메뉴명 목록 → 일반/초성 역색인 (행 번호는 카탈로그 순서와 같음)."""
+
+    def __init__(self, menus):
+        self.menus = list(menus)
+        self.keys = [normalize_key(m) for m in self.menus]
+        self.choseong = [to_choseong(k) for k in self.keys]
+        self._postings = _build_postings(self.keys)
+        self._cho_postings = _build_postings(self.choseong)
+        self._key_set = set(self.keys)
+
+    def __len__(self):
+        return len(self.menus)
+
+    def contains(self, name: str) -> bool:
+        """카탈로그에 같은 메뉴명(공백·대소문자 무시)이 있는지."""
+        return normalize_key(name) in self._key_set
+
+    def search(self, query: str, limit: int | None = DEFAULT_LIMIT, fuzzy: bool = True) -> list[int]:
+        """
+        순위순 행 번호 목록
+        1) 검색어를 포함하는 메뉴: 앞부분 일치 → 등장 위치 → 짧은 이름 순
+        2) (fuzzy, 3글자 이상) 오타 허용 결과: 편집 거리 → 짧은 이름 순
+        """
+        q = normalize_key(query)
+        if not q:
+            return []
+        cho = is_choseong_query(q)
+        if cho:
+            q = to_choseong(q)
+        keys = self.choseong if cho else self.keys
+        postings = self._cho_postings if cho else self._postings
+
+        # 1) 검색어의 gram 을 모두 가진 행만 후보 (가장 짧은 목록부터 교집합)
+        lists = sorted((postings.get(g, []) for g in _query_grams(q)), key=len)
+        candidates = set(lists[0]).intersection(*lists[1:]) if lists else set()
+        hits = [i for i in candidates if q in keys[i]]
+        hits.sort(key=lambda i: (not keys[i].startswith(q), keys[i].find(q), len(keys[i]), i))
+        if limit is not None and len(hits) >= limit:
+            return hits[:limit]
+
+        # 2) 오타 허용: 2-gram 을 많이 공유하는 행부터 편집 거리로 확인
+        if fuzzy and not cho and len(q) >= 3:
+            max_dist = 1 if len(q) <= 4 else 2
+            qgrams = _query_grams(q)
+            need = max(1, len(qgrams) - 2 * max_dist)
+            shared = Counter(i for g in qgrams for i in postings.get(g, ()))
+            found = set(hits)
+            near = []
+            for i, n in shared.most_common(FUZZY_CANDIDATES + len(found)):
+                if n < need:
+                    break
+                if i in found:
+                    continue
+                d = substring_distance(q, keys[i], max_dist)
+                if d <= max_dist:
+                    near.append((d, len(keys[i]), i))
+            hits += [i for _, _, i in sorted(near)]
+        return hits if limit is None else hits[:limit]
+
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def _search_index_cached(path: str, mtime_ns: int, size: int) -> MenuSearchIndex | None:
+    # 카탈로그와 같은 키 (파일이 교체되면 새로 색인)
+    catalog = load_menu_catalog(xlsx_sig=(path, mtime_ns, size))
+    return MenuSearchIndex(catalog["menu"]) if catalog else None
+
+
+def get_search_index(xlsx_candidates=None, xlsx_sig=None) -> MenuSearchIndex | None:
+    """캐시된 검색 인덱스 (menu.xlsx 가 없거나 파싱에 실패하면 None)."""
+    sig = xlsx_sig or find_menu_xlsx(xlsx_candidates)
+    return _search_index_cached(*sig) if sig else None
+
+
+def search_menus(query: str, limit: int | None = DEFAULT_LIMIT, xlsx_candidates=None,
+                 xlsx_sig=None) -> list[dict]:
+    """
+    menu.xlsx 에서 메뉴를 검색해 순위순 행(menu/category/code/large/middle/cook) 목록을 반환합니다.
+    파일이 없거나 파싱에 실패하면 [].
+    """
+    sig = xlsx_sig or find_menu_xlsx(xlsx_candidates)
+    if sig is None:
+        return []
+    index = _search_index_cached(*sig)
+    catalog = load_menu_catalog(xlsx_sig=sig)
+    if index is None or catalog is None:
+        return []
+    return [catalog_row(catalog, i) for i in index.search(query, limit)]
+
+
+def clear_search_cache():
+    """검색 인덱스 캐시를 비웁니다 (clear_catalog_cache 와 함께 호출)."""
+    _search_index_cached.clear()
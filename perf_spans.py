@@ -0,0 +1,193 @@
+"""
+핫패스 계측 (span / 타이머)
+
+- with span("이름"): ... 또는 @timed("이름") 으로 구간 시간을 잽니다 (perf_counter, 락 1회).
+- 프로세스 전체(모든 세션·백그라운드 스레드)와 현재 세션 두 곳에 히스토그램으로 누적합니다.
+  백그라운드 작업 스레드처럼 세션이 없는 곳에서는 프로세스 집계에만 남습니다.
+- 관리자 패널(render_perf_panel)과 Prometheus 텍스트 형식(prometheus_text)으로 내보냅니다.
+- 리런 전체 시간: 스크립트 맨 위 begin_rerun(), 맨 아래 end_rerun()
+  (st.rerun()/st.stop() 으로 중간에 끝난 리런은 기록되지 않습니다).
+"""
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+from typing import TYPE_CHECKING
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+# 히스토그램 버킷 상한 (밀리초)
+BUCKETS_MS = (1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+SESSION_KEY = "_perf_spans"
+RERUN_SPAN = "rerun"
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+class Histogram:
+    """고정 버킷 히스토그램 (횟수/합계/최대 + 버킷별 누적 개수)."""
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS_MS) + 1)  # 마지막 = +Inf
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, ms: float):
+        i = 0
+        while i < len(BUCKETS_MS) and ms > BUCKETS_MS[i]:
+            i += 1
+        self.counts[i] += 1
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    def quantile(self, q: float) -> float:
+        """버킷 안 선형 보간으로 추정한 분위수 (Prometheus histogram_quantile 과 같은 방식)."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            if seen + n >= rank and n:
+                lo = BUCKETS_MS[i - 1] if i > 0 else 0.0
+                hi = BUCKETS_MS[i] if i < len(BUCKETS_MS) else self.max_ms
+                return min(lo + (hi - lo) * (rank - seen) / n, self.max_ms)
+            seen += n
+        return self.max_ms
+
+
+class SpanRegistry:
+    """span 이름 → Histogram (스레드 안전)."""
+
+    def __init__(self):
+        self._hist: dict[str, Histogram] = {}
+        self._lock = threading.Lock()
+        self.started_at = time.time()
+
+    def observe(self, name: str, ms: float):
+        with self._lock:
+            hist = self._hist.get(name)
+            if hist is None:
+                hist = self._hist[name] = Histogram()
+            hist.observe(ms)
+
+    def count(self, name: str) -> int:
+        with self._lock:
+            hist = self._hist.get(name)
+            return hist.count if hist else 0
+
+    def reset(self):
+        with self._lock:
+            self._hist.clear()
+            self.started_at = time.time()
+
+    def to_frame(self) -> "pd.DataFrame":
+        # 화면 표시용 요약 (합계 시간이 큰 순) — pandas 는 여기서만 import (로그인 화면 리런에서는 불필요)
+        import pandas as pd
+
+        with self._lock:
+            rows = [{
+                "구간": name,
+                "횟수": h.count,
+                "평균(ms)": round(h.total_ms / h.count, 1),
+                "p50(ms)": round(h.quantile(0.5), 1),
+                "p95(ms)": round(h.quantile(0.95), 1),
+                "최대(ms)": round(h.max_ms, 1),
+                "합계(s)": round(h.total_ms / 1000, 2),
+            } for name, h in self._hist.items() if h.count]
+        columns = ["구간", "횟수", "평균(ms)", "p50(ms)", "p95(ms)", "최대(ms)", "합계(s)"]
+        return pd.DataFrame(rows, columns=columns).sort_values("합계(s)", ascending=False, ignore_index=True)
+
+    def prometheus_text(self, metric: str = "app_span_duration_seconds") -> str:
+        """Prometheus 텍스트 노출 형식 (histogram, 초 단위)."""
+        lines = [f"# HELP {metric} Duration of instrumented app spans.", f"# TYPE {metric} histogram"]
+        with self._lock:
+            for name in sorted(self._hist):
+                h = self._hist[name]
+                label = name.replace("\\", "\\\\").replace('"', '\\"')
+                cumulative = 0
+                for upper, n in zip(BUCKETS_MS, h.counts):
+                    cumulative += n
+                    lines.append(f'{metric}_bucket{{span="{label}",le="{upper / 1000:g}"}} {cumulative}')
+                lines.append(f'{metric}_bucket{{span="{label}",le="+Inf"}} {h.count}')
+                lines.append(f'{metric}_sum{{span="{label}"}} {h.total_ms / 1000:.6f}')
+                lines.append(f'{metric}_count{{span="{label}"}} {h.count}')
+        return "\n".join(lines) + "\n"
+
+
+# 프로세스 집계 — 모듈 전역 (리런마다 app.py 가 다시 실행돼도 유지, 작업 스레드에서도 사용)
+PROCESS_SPANS = SpanRegistry()
+
+
+def _session_spans() -> SpanRegistry | None:
+    # 스크립트 스레드일 때만 세션 집계 (작업 스레드에는 세션 컨텍스트가 없음)
+    if get_script_run_ctx() is None:
+        return None
+    spans = st.session_state.get(SESSION_KEY)
+    if spans is None:
+        spans = st.session_state[SESSION_KEY] = SpanRegistry()
+    return spans
+
+
+def record(name: str, ms: float):
+    PROCESS_SPANS.observe(name, ms)
+    session = _session_spans()
+    if session is not None:
+        session.observe(name, ms)
+
+
+@contextmanager
+def span(name: str):
+    """with span("admin.signed_urls"): ... — 예외가 나도 시간은 기록합니다."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(name, (time.perf_counter() - start) * 1000)
+
+
+def timed(name: str | None = None):
+    """@timed("supabase.get_client") — 함수 호출 시간을 span 으로 기록합니다."""
+    def decorator(fn):
+        label = name or fn.__name__
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            with span(label):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def begin_rerun():
+    if get_script_run_ctx() is not None:
+        st.session_state["_perf_rerun_start"] = time.perf_counter()
+
+
+def end_rerun():
+    start = st.session_state.pop("_perf_rerun_start", None) if get_script_run_ctx() is not None else None
+    if start is not None:
+        record(RERUN_SPAN, (time.perf_counter() - start) * 1000)
+
+
+def render_perf_panel():
+    """관리자 전용: 세션/프로세스 span 요약 + Prometheus 텍스트 내보내기."""
+    with st.expander("⏱️ 성능 계측 (span)"):
+        scope = st.radio("집계 범위", ["프로세스 전체", "이 세션"], horizontal=True, key="perf_scope")
+        spans = PROCESS_SPANS if scope == "프로세스 전체" else (_session_spans() or SpanRegistry())
+        df = spans.to_frame()
+        if df.empty:
+            st.caption("아직 기록된 구간이 없습니다.")
+        else:
+            st.dataframe(df, use_container_width=True, hide_index=True)
+        col1, col2 = st.columns(2)
+        with col1:
+            st.download_button("📈 Prometheus 텍스트", data=PROCESS_SPANS.prometheus_text(),
+                               file_name="metrics.prom", mime="text/plain", use_container_width=True)
+        with col2:
+            if st.button("🧹 초기화", key="perf_reset", use_container_width=True):
+                spans.reset()
+                st.rerun()
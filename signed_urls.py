@@ -0,0 +1,106 @@
+"""
+Supabase Storage 서명 URL 캐시 + 일괄 발급
+
+- create_signed_urls 로 여러 경로를 한 번의 요청으로 서명합니다.
+- 발급한 URL 은 만료 직전(refresh_margin 초 전)까지 재사용합니다.
+"""
+import threading
+import time
+
+# 한 번의 일괄 서명 요청에 넣을 최대 경로 수
+BATCH_SIZE = 100
+
+
+def _extract_url(item: dict) -> str:
+    # supabase-py/storage3 버전에 따라 키 이름이 다릅니다
+    return item.get("signedURL") or item.get("signedUrl") or item.get("signed_url") or ""
+
+
+class SignedUrlCache:
+    """경로 → (서명 URL, 재발급 시각) TTL 캐시. 여러 세션이 공유합니다."""
+
+    def __init__(self, refresh_margin: int = 300):
+        self.refresh_margin = refresh_margin
+        self._data: dict[tuple[str, str], tuple[str, float]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.requests = 0
+
+    def get(self, bucket: str, path: str) -> str | None:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get((bucket, path))
+            if entry and entry[1] > now:
+                self.hits += 1
+                return entry[0]
+            if entry:
+                del self._data[(bucket, path)]
+            self.misses += 1
+            return None
+
+    def put(self, bucket: str, path: str, url: str, expire_seconds: int):
+        if not url:
+            return
+        # 만료 refresh_margin 초 전까지만 재사용 (너무 짧은 만료는 절반까지만)
+        ttl = max(expire_seconds - self.refresh_margin, expire_seconds // 2)
+        with self._lock:
+            self._data[(bucket, path)] = (url, time.monotonic() + ttl)
+
+    def lookup_many(self, bucket: str, paths) -> dict[str, str]:
+        """캐시에 살아 있는 URL 만 반환합니다 (네트워크 요청 없음)."""
+        out = {}
+        for p in paths:
+            url = self.get(bucket, p)
+            if url:
+                out[p] = url
+        return out
+
+    def _count_request(self):
+        with self._lock:
+            self.requests += 1
+
+    def sign_one(self, sb, bucket: str, path: str, expire_seconds: int = 3600) -> str:
+        url = self.get(bucket, path)
+        if url:
+            return url
+        self._count_request()
+        r = sb.storage.from_(bucket).create_signed_url(path, expire_seconds)
+        url = _extract_url(r or {})
+        self.put(bucket, path, url, expire_seconds)
+        return url
+
+    def sign_many(self, sb, bucket: str, paths, expire_seconds: int = 3600) -> dict[str, str]:
+        """
+        경로 목록 → {경로: 서명 URL}
+        캐시에 없는 경로만 BATCH_SIZE 단위로 create_signed_urls 호출 (실패한 경로는 제외).
+        """
+        paths = list(dict.fromkeys(p for p in paths if p))
+        out = self.lookup_many(bucket, paths)
+        missing = [p for p in paths if p not in out]
+        api = sb.storage.from_(bucket)
+        for i in range(0, len(missing), BATCH_SIZE):
+            chunk = missing[i:i + BATCH_SIZE]
+            self._count_request()
+            try:
+                items = api.create_signed_urls(chunk, expire_seconds)
+            except AttributeError:
+                # 일괄 API 가 없는 구버전: 경로별 발급
+                for p in chunk:
+                    url = self.sign_one(sb, bucket, p, expire_seconds)
+                    if url:
+                        out[p] = url
+                continue
+            for item in items or []:
+                if item.get("error"):
+                    continue
+                p, url = item.get("path"), _extract_url(item)
+                if p and url:
+                    self.put(bucket, p, url, expire_seconds)
+                    out[p] = url
+        return out
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"entries": len(self._data), "hits": self.hits,
+                    "misses": self.misses, "requests": self.requests}
@@ -0,0 +1,19 @@
+-- 관리자 통계 카드용 집계 함수 (Supabase SQL Editor 에서 1회 실행)
+-- 총 제출 수 / 참여 사용자 / 평균 소요시간(초) / 오늘(tz 기준) 제출 수
+create or replace function public.submission_stats(tz text default 'Asia/Seoul')
+returns table (total bigint, users bigint, avg_sec numeric, today bigint)
+language sql
+stable
+as $$
+  select
+    count(*)                                   as total,
+    count(distinct "사용자")                    as users,
+    coalesce(avg("소요시간(초)"), 0)             as avg_sec,
+    count(*) filter (
+      where ("제출시간"::timestamptz at time zone tz)::date
+            = (now() at time zone tz)::date
+    )                                          as today
+  from public.submissions;
+$$;
+
+grant execute on function public.submission_stats(text) to service_role;
@@ -0,0 +1,77 @@
+"""
+메뉴 관리 컴포넌트 정적 자산
+
+- 컴포넌트 폴더(menu_component/frontend/)의 파일은 컴포넌트 경로로 서빙됩니다 (Cache-Control: public).
+- 정적 엑셀 등은 Streamlit 정적 파일 서빙(static/ → /app/static/...)으로 제공합니다
+  (.streamlit/config.toml 의 server.enableStaticServing = true).
+- URL 에 내용 해시(?v=sha256 앞 12자리)를 붙여, 파일 내용이 바뀔 때만 브라우저가 새로 받습니다.
+- 폐쇄망: menu_component/frontend/vendor/xlsx.full.min.js 를 두면 CDN 을 사용하지 않습니다.
+  secrets 의 SHEETJS_CDN_URL 을 "" 로 두면 로컬 사본이 없을 때도 CDN 에 요청하지 않습니다.
+- 서버가 menu.xlsx 를 파싱해 보낸 경우 컴포넌트는 SheetJS 를 아예 불러오지 않습니다.
+"""
+import hashlib
+import os
+from urllib.parse import quote
+
+import streamlit as st
+
+from cache_utils import file_signature
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+STATIC_DIR = os.path.join(BASE_DIR, "static")
+COMPONENT_DIR = os.path.join(BASE_DIR, "menu_component", "frontend")
+SHEETJS_FILE = "vendor/xlsx.full.min.js"
+ENGINE_FILE = "engine.js"
+SHEETJS_CDN_URL = "https://cdn.jsdelivr.net/npm/xlsx@0.18.5/dist/xlsx.full.min.js"
+# 컴포넌트의 XLSX 폴백(fetch) 경로로 쓸 수 있는 정적 엑셀
+STATIC_XLSX_FILES = ["menu.xlsx"]
+
+
+@st.cache_data(show_spinner=False)
+def _content_hash(path: str, mtime_ns: int, size: int) -> str:
+    # mtime_ns/size 는 캐시 키 용도 (파일이 바뀌면 다시 계산)
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            h.update(chunk)
+    return h.hexdigest()[:12]
+
+
+def static_serving_enabled() -> bool:
+    return bool(st.get_option("server.enableStaticServing"))
+
+
+def static_url(relpath: str) -> str | None:
+    """static/ 아래 파일의 서빙 URL (?v=내용 해시). 파일이 없거나 정적 서빙이 꺼져 있으면 None."""
+    sig = file_signature(os.path.join(STATIC_DIR, relpath))
+    if sig is None or not static_serving_enabled():
+        return None
+    base = (st.get_option("server.baseUrlPath") or "").strip("/")
+    prefix = f"/{base}/app/static/" if base else "/app/static/"
+    return f"{prefix}{quote(relpath)}?v={_content_hash(*sig)}"
+
+
+def component_file_url(relpath: str) -> str | None:
+    """컴포넌트 폴더 파일의 상대 URL (?v=내용 해시). 파일이 없으면 None."""
+    sig = file_signature(os.path.join(COMPONENT_DIR, relpath))
+    if sig is None:
+        return None
+    return f"{quote(relpath)}?v={_content_hash(*sig)}"
+
+
+def sheetjs_url() -> str | None:
+    """SheetJS 위치: 컴포넌트 폴더 사본 → 정적 폴더 사본 → (허용 시) CDN → None(사용 안 함)."""
+    local = component_file_url(SHEETJS_FILE) or static_url(SHEETJS_FILE)
+    if local:
+        return local
+    return st.secrets.get("SHEETJS_CDN_URL", SHEETJS_CDN_URL) or None
+
+
+def component_assets() -> dict:
+    """
+    컴포넌트에 render 인자로 보낼 자산 위치
+    {"sheetjs": SheetJS URL 또는 None, "xlsx": [폴백 fetch 용 엑셀 URL, ...], "engine": 메뉴 엔진 URL}
+    """
+    xlsx = [u for u in (static_url(name) for name in STATIC_XLSX_FILES) if u]
+    return {"sheetjs": sheetjs_url(), "xlsx": xlsx, "engine": component_file_url(ENGINE_FILE) or ENGINE_FILE}
+
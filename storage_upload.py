@@ -0,0 +1,108 @@
+"""
+Supabase Storage 업로드 전략 (클라이언트 버전별 호환 방식 1회 탐지 후 재사용)
+
+supabase-py/storage3 버전에 따라
+- upsert 옵션 키가 다르고 ("upsert" / "x-upsert")
+- 구버전은 bytes 대신 파일 경로 문자열을 요구합니다.
+처음 성공한 조합을 기억해 두고, 이후 업로드는 그 조합으로 한 번만 요청합니다.
+"""
+import os
+import tempfile
+import threading
+from collections import Counter
+
+XLSX_MIME = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+# 서로 다른 supabase-py 버전 호환 (upsert 키가 다릅니다)
+OPTION_SETS = [
+    {"contentType": XLSX_MIME, "cacheControl": "3600", "upsert": "true"},
+    {"contentType": XLSX_MIME, "cacheControl": "3600", "x-upsert": "true"},
+]
+
+# 파일 전달 방식: bytes 그대로 / 임시 파일 경로(구버전)
+MODES = ["bytes", "path"]
+
+
+def _upload_once(api, path: str, file_bytes: bytes, mode: str, opts: dict):
+    if mode == "bytes":
+        api.upload(path=path, file=file_bytes, file_options=opts)
+        return
+    # 경로 문자열 요구하는 구버전 대응: 임시 파일로 저장 후 경로 전달
+    fd, tmp_name = tempfile.mkstemp(suffix=".xlsx")
+    try:
+        with os.fdopen(fd, "wb") as tmp:
+            tmp.write(file_bytes)
+        api.upload(path=path, file=tmp_name, file_options=opts)
+    finally:
+        try:
+            os.remove(tmp_name)
+        except OSError:
+            pass
+
+
+class UploadStrategy:
+    """
+    업로드 호환 조합(mode, 옵션) 캐시 + 업로드별 시도 횟수 지표
+    (get_supabase 와 같은 버전 키로 st.cache_resource 에 보관 → 클라이언트가 바뀌면 재탐지)
+    """
+
+    def __init__(self):
+        self.mode: str | None = None
+        self.option_index: int | None = None
+        self._lock = threading.Lock()
+        self.uploads = 0
+        self.failures = 0
+        self.attempts_total = 0
+        self.attempts_hist: Counter = Counter()
+
+    @property
+    def detected(self) -> bool:
+        return self.mode is not None
+
+    def _candidates(self):
+        if self.detected:
+            return [(self.mode, self.option_index)]
+        return [(m, i) for m in MODES for i in range(len(OPTION_SETS))]
+
+    def upload(self, api, path: str, file_bytes: bytes) -> int:
+        """업로드하고 시도 횟수를 반환합니다. 모두 실패하면 RuntimeError."""
+        attempts, last_err = 0, None
+        for mode, idx in self._candidates():
+            attempts += 1
+            try:
+                _upload_once(api, path, file_bytes, mode, OPTION_SETS[idx])
+            except Exception as e:
+                last_err = e
+                continue
+            with self._lock:
+                self.mode, self.option_index = mode, idx
+            self._record(attempts, ok=True)
+            return attempts
+        self._record(attempts, ok=False)
+        # 모두 실패 시 원인 표출
+        raise RuntimeError(f"storage upload failed: {last_err}")
+
+    def _record(self, attempts: int, ok: bool):
+        with self._lock:
+            self.uploads += 1
+            self.attempts_total += attempts
+            self.attempts_hist[attempts] += 1
+            if not ok:
+                self.failures += 1
+
+    def reset(self):
+        """탐지 결과를 지우고 다음 업로드에서 다시 탐지합니다."""
+        with self._lock:
+            self.mode, self.option_index = None, None
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "mode": self.mode,
+                "option_index": self.option_index,
+                "uploads": self.uploads,
+                "failures": self.failures,
+                "attempts_total": self.attempts_total,
+                "attempts_avg": round(self.attempts_total / self.uploads, 2) if self.uploads else 0.0,
+                "attempts_hist": dict(self.attempts_hist),
+            }
@@ -0,0 +1,111 @@
+"""
+로컬 제출 로그 (log.csv) — 추가 전용 + 파일 잠금
+
+- 제출 1건당 한 줄만 덧붙입니다 (전체 읽기/다시 쓰기 없음).
+- 여러 Streamlit 세션이 동시에 제출해도 잠금으로 행이 유실되지 않습니다.
+- 누락 컬럼(파일경로/식단표종류 등) 보정은 시작 시 한 번만 수행합니다.
+"""
+import csv
+import os
+import threading
+from contextlib import contextmanager
+
+import pandas as pd
+import streamlit as st
+
+from cache_utils import file_signature
+
+try:  # POSIX
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+LOG_COLUMNS = ["사용자", "시작시간", "제출시간", "소요시간(초)", "식단표종류", "파일경로"]
+
+# 같은 프로세스 안의 스레드 간 잠금 (파일 잠금은 프로세스 간)
+_thread_lock = threading.Lock()
+
+
+@contextmanager
+def log_lock(path: str):
+    """path 전용 잠금 파일(path.lock)로 배타적 잠금을 잡습니다."""
+    with _thread_lock, open(path + ".lock", "a+") as lf:
+        if fcntl:
+            fcntl.flock(lf.fileno(), fcntl.LOCK_EX)
+        else:
+            lf.seek(0)
+            msvcrt.locking(lf.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(lf.fileno(), fcntl.LOCK_UN)
+            else:
+                lf.seek(0)
+                msvcrt.locking(lf.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def _read_header(path: str) -> list[str] | None:
+    if not os.path.exists(path) or os.path.getsize(path) == 0:
+        return None
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        return next(csv.reader(f), None)
+
+
+def _ends_with_newline(path: str) -> bool:
+    with open(path, "rb") as f:
+        f.seek(-1, os.SEEK_END)
+        return f.read(1) in (b"\n", b"\r")
+
+
+def migrate_log_schema(path: str, columns=LOG_COLUMNS) -> list[str]:
+    """
+    헤더에 없는 컬럼을 추가해 다시 씁니다 (누락이 있을 때만, 잠금 상태에서).
+    최종 헤더를 반환합니다.
+    """
+    with log_lock(path):
+        header = _read_header(path)
+        if header is None:
+            return list(columns)
+        missing = [c for c in columns if c not in header]
+        if not missing:
+            return header
+        df = pd.read_csv(path)
+        for col in missing:
+            df[col] = None
+        tmp = path + ".tmp"
+        df.to_csv(tmp, index=False)
+        os.replace(tmp, path)
+        return list(df.columns)
+
+
+def append_log_row(path: str, row: dict, columns=LOG_COLUMNS):
+    """제출 1건을 log.csv 끝에 덧붙입니다 (파일이 없으면 헤더부터 작성)."""
+    with log_lock(path):
+        header = _read_header(path)
+        needs_newline = header is not None and not _ends_with_newline(path)
+        with open(path, "a", encoding="utf-8", newline="") as f:
+            if header is None:
+                header = list(columns)
+                csv.writer(f).writerow(header)
+            elif needs_newline:
+                # 이전 쓰기가 줄바꿈 없이 끝났다면 보정
+                f.write("\n")
+            writer = csv.DictWriter(f, fieldnames=header, extrasaction="ignore")
+            writer.writerow({k: ("" if v is None else v) for k, v in row.items()})
+            f.flush()
+            os.fsync(f.fileno())
+
+
+@st.cache_data(show_spinner=False)
+def _read_log_cached(path: str, mtime_ns: int, size: int) -> pd.DataFrame:
+    return pd.read_csv(path)
+
+
+def read_log_df(path: str) -> pd.DataFrame:
+    """관리자 화면용 읽기 — 파일이 바뀌지 않았으면 파싱 결과를 재사용합니다."""
+    sig = file_signature(path)
+    if sig is None:
+        return pd.DataFrame(columns=LOG_COLUMNS)
+    return _read_log_cached(*sig)
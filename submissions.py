@@ -0,0 +1,266 @@
+"""
+Supabase submissions 테이블 조회 (키셋 페이지네이션 + 증분 스냅샷)
+
+- 제출시간 기준 키셋 페이지네이션 (offset 없이 커서 값으로 다음 페이지)
+- 관리자 화면에 필요한 컬럼만 조회 (select * 대신 프로젝션)
+- 스냅샷은 마지막으로 본 제출시간보다 새로운 행만 추가로 가져옵니다.
+- 통계 카드(총 제출/참여 사용자/평균 소요시간/오늘 제출)는 집계 RPC 로 계산합니다.
+"""
+import threading
+import time
+from datetime import date, datetime
+from zoneinfo import ZoneInfo
+
+import pandas as pd
+
+TABLE = "submissions"
+ORDER_COL = "제출시간"
+
+# 관리자 화면에서 표시/사용하는 컬럼
+ADMIN_COLUMNS = ["사용자", "시작시간", "제출시간", "소요시간(초)", "식단표종류", "파일경로", "원본파일명"]
+
+# 같은 제출시간이 여러 행일 수 있어 중복 제거용 키로 사용
+ROW_KEY = ("사용자", "제출시간", "파일경로")
+
+DEFAULT_PAGE_SIZE = 1000
+
+# 통계 집계 함수 (sql/submission_stats.sql 로 생성)
+STATS_RPC = "submission_stats"
+STATS_TZ = "Asia/Seoul"
+# 함수가 없을 때 PostgREST 오류 코드 (스키마 캐시에 없음 / Postgres undefined_function)
+RPC_MISSING_CODES = {"PGRST202", "42883"}
+
+
+def _select_expr(columns) -> str:
+    # 괄호 등 특수문자가 있는 한글 컬럼명은 PostgREST 에서 큰따옴표로 감싸야 합니다
+    return ",".join(f'"{c}"' if not c.isidentifier() else c for c in columns)
+
+
+def _row_key(row: dict) -> tuple:
+    return tuple(row.get(k) for k in ROW_KEY)
+
+
+def fetch_submissions_page(sb, *, before=None, since=None, page_size: int = DEFAULT_PAGE_SIZE,
+                           offset: int = 0, columns=ADMIN_COLUMNS) -> list[dict]:
+    """
+    제출시간 키셋 페이지 1개를 조회합니다.
+
+    - before: 이 값 이하(<=)인 행을 내림차순으로 (과거 방향 페이지)
+    - since : 이 값 이상(>=)인 행을 오름차순으로 (새 행 증분 조회)
+    - offset: 같은 제출시간 행이 한 페이지를 넘길 때만 사용 (평소에는 0)
+    커서 값과 같은 제출시간의 행이 다시 올 수 있으므로 경계 중복은 호출자가 제거합니다.
+    """
+    q = sb.table(TABLE).select(_select_expr(columns))
+    if since is not None:
+        q = q.gte(ORDER_COL, since).order(ORDER_COL, desc=False)
+    else:
+        if before is not None:
+            q = q.lte(ORDER_COL, before)
+        q = q.order(ORDER_COL, desc=True)
+    q = q.limit(page_size)
+    if offset:
+        q = q.offset(offset)
+    res = q.execute()
+    return res.data or []
+
+
+def iter_submission_pages(sb, *, page_size: int = DEFAULT_PAGE_SIZE, columns=ADMIN_COLUMNS,
+                          max_rows: int | None = None):
+    """최신순으로 (중복 제거된) 페이지 단위 반복 (max_rows 를 넘으면 중단)."""
+    before, offset, seen, total = None, 0, set(), 0
+    while True:
+        page = fetch_submissions_page(sb, before=before, offset=offset, page_size=page_size,
+                                      columns=columns)
+        fresh = [r for r in page if _row_key(r) not in seen]
+        seen.update(_row_key(r) for r in fresh)
+        if fresh:
+            yield fresh
+        total += len(fresh)
+        if len(page) < page_size or (max_rows is not None and total >= max_rows):
+            return
+        before, offset = _advance(before, offset, page)
+
+
+def _advance(cursor, offset: int, page: list[dict]):
+    """다음 키셋 커서. 페이지 전체가 같은 제출시간이면 커서 대신 offset 을 늘립니다."""
+    last = page[-1][ORDER_COL]
+    if last == cursor:
+        return cursor, offset + len(page)
+    return last, 0
+
+
+class SubmissionSnapshot:
+    """
+    submissions 테이블의 로컬 스냅샷 (st.cache_resource 로 리런/세션 간 공유)
+
+    - 첫 refresh: 키셋 페이지네이션으로 전체(또는 max_rows) 로드
+    - 이후 refresh: 마지막 제출시간 이후 행만 조회해 앞에 붙임
+    - 사용자별 인덱스(사용자 → 제출 최신순)도 같이 갱신 → 사용자 선택 화면은 O(k)
+    """
+
+    def __init__(self, page_size: int = DEFAULT_PAGE_SIZE, columns=ADMIN_COLUMNS,
+                 max_rows: int | None = None):
+        self.page_size = page_size
+        self.columns = list(columns)
+        self.max_rows = max_rows
+        self._rows: list[dict] = []   # 제출시간 내림차순
+        self._keys: set = set()
+        self._latest = None
+        self._loaded = False
+        self._df: pd.DataFrame | None = None
+        self._by_user: dict[str, list[dict]] = {}  # 사용자 → 행 (제출시간 내림차순)
+        self._users: list[str] = []                # 최근 제출한 사용자 순 (DataFrame unique() 순서와 같음)
+        self._lock = threading.Lock()
+
+    def _full_load(self, sb):
+        rows = []
+        for page in iter_submission_pages(sb, page_size=self.page_size, columns=self.columns,
+                                          max_rows=self.max_rows):
+            rows.extend(page)
+        self._rows = rows
+        self._keys = {_row_key(r) for r in rows}
+        self._latest = rows[0][ORDER_COL] if rows else None
+        self._loaded = True
+        self._df = None
+        self._by_user, self._users = {}, []
+        self._index_newer(rows)
+
+    def _fetch_newer(self, sb) -> int:
+        new_rows, cursor, offset = [], self._latest, 0
+        while True:
+            page = fetch_submissions_page(sb, since=cursor, offset=offset,
+                                          page_size=self.page_size, columns=self.columns)
+            fresh = [r for r in page if _row_key(r) not in self._keys]
+            self._keys.update(_row_key(r) for r in fresh)
+            new_rows.extend(fresh)
+            if len(page) < self.page_size:
+                break
+            cursor, offset = _advance(cursor, offset, page)
+        if new_rows:
+            new_rows.reverse()  # 오름차순 → 내림차순
+            self._rows = new_rows + self._rows
+            self._latest = self._rows[0][ORDER_COL]
+            self._df = None
+            self._index_newer(new_rows)
+        return len(new_rows)
+
+    def _index_newer(self, rows: list[dict]):
+        # rows(내림차순, 기존 행보다 새로움)를 사용자별 목록 앞에 붙임 — 새 행 수에 비례
+        grouped: dict[str, list[dict]] = {}
+        for r in rows:
+            grouped.setdefault(r.get("사용자"), []).append(r)
+        for user, user_rows in grouped.items():
+            self._by_user[user] = user_rows + self._by_user.get(user, [])
+        # 새로 제출한 사용자를 맨 앞으로 (최근 제출 순서 유지)
+        self._users = list(grouped) + [u for u in self._users if u not in grouped]
+
+    def users(self) -> list[str]:
+        """제출 기록이 있는 사용자 (최근 제출 순)."""
+        with self._lock:
+            return list(self._users)
+
+    def user_rows(self, user: str) -> list[dict]:
+        """user 의 제출 행 (제출시간 내림차순). 마지막 refresh 기준입니다."""
+        with self._lock:
+            return list(self._by_user.get(user, ()))
+
+    def refresh(self, sb) -> pd.DataFrame:
+        """새 행을 반영한 DataFrame (변경이 없으면 이전 DataFrame 재사용)."""
+        with self._lock:
+            if not self._loaded or self._latest is None:
+                self._full_load(sb)
+            else:
+                self._fetch_newer(sb)
+            if self._df is None:
+                self._df = pd.DataFrame(self._rows, columns=self.columns)
+            return self._df
+
+    def reset(self):
+        """다음 refresh 에서 전체를 다시 읽도록 초기화합니다 (행 삭제/수정 반영용)."""
+        with self._lock:
+            self._loaded = False
+            self._rows, self._keys, self._latest, self._df = [], set(), None, None
+            self._by_user, self._users = {}, []
+
+
+# ===== 통계 카드 ======================================================
+class RpcAvailability:
+    """집계 RPC 미설치 기억 — recheck_seconds 동안은 호출하지 않고 바로 폴백 (설치 후에는 다시 확인)."""
+
+    def __init__(self, recheck_seconds: float = 600.0):
+        self.recheck_seconds = recheck_seconds
+        self._missing_until = 0.0
+        self.skipped = 0
+
+    def available(self) -> bool:
+        if time.monotonic() < self._missing_until:
+            self.skipped += 1
+            return False
+        return True
+
+    def mark_missing(self):
+        self._missing_until = time.monotonic() + self.recheck_seconds
+
+
+def fetch_submission_stats(sb, tz: str = STATS_TZ, availability: RpcAvailability | None = None) -> dict | None:
+    """
+    DB 집계 함수로 4개 통계를 계산합니다 (테이블 전송 없음).
+    함수가 아직 생성되지 않았거나 호출에 실패하면 None → 호출자가 compute_stats 로 폴백.
+    availability 를 넘기면 '함수 없음' 응답을 기억해 이후 리런에서는 요청을 보내지 않습니다
+    (네트워크 오류 등 일시적 실패는 기억하지 않음).
+    """
+    if availability is not None and not availability.available():
+        return None
+    try:
+        res = sb.rpc(STATS_RPC, {"tz": tz}).execute()
+    except Exception as e:
+        if availability is not None and getattr(e, "code", None) in RPC_MISSING_CODES:
+            availability.mark_missing()
+        return None
+    data = res.data
+    if isinstance(data, list):
+        data = data[0] if data else None
+    if not data:
+        return None
+    return {
+        "total": int(data.get("total") or 0),
+        "users": int(data.get("users") or 0),
+        "avg_sec": int(float(data.get("avg_sec") or 0)),
+        "today": int(data.get("today") or 0),
+    }
+
+
+def parse_submit_times(series: pd.Series, tz: str = STATS_TZ) -> pd.Series:
+    """
+    제출시간 문자열 → tz 기준 datetime
+    - Supabase: ISO + 오프셋 (예: 2025-10-17T10:00:00+09:00)
+    - log.csv : 오프셋 없는 KST (예: 2025-10-17 10:00:00) → tz 로 간주
+    """
+    s = series.astype(str).str.strip()
+    aware = s.str.contains(r"(?:[+-]\d{2}:?\d{2}|Z)$", regex=True)
+    out = pd.Series(pd.NaT, index=s.index, dtype=f"datetime64[ns, {tz}]")
+    if aware.any():
+        out[aware] = pd.to_datetime(s[aware], errors="coerce", utc=True, format="ISO8601").dt.tz_convert(tz)
+    if (~aware).any():
+        out[~aware] = pd.to_datetime(s[~aware], errors="coerce", format="ISO8601").dt.tz_localize(tz)
+    return out
+
+
+def compute_stats(df: pd.DataFrame, today: date | None = None, tz: str = STATS_TZ) -> dict:
+    """pandas 폴백 (log.csv 모드 / RPC 미설치) — 문자열 포함 검색 대신 파싱된 날짜로 비교."""
+    if df is None or df.empty:
+        return {"total": 0, "users": 0, "avg_sec": 0, "today": 0}
+    if today is None:
+        today = datetime.now(ZoneInfo(tz)).date()
+
+    avg = pd.to_numeric(df["소요시간(초)"], errors="coerce").mean() if "소요시간(초)" in df.columns else None
+    if "제출시간" in df.columns:
+        today_count = int((parse_submit_times(df["제출시간"], tz).dt.date == today).sum())
+    else:
+        today_count = 0
+    return {
+        "total": int(len(df)),
+        "users": int(df["사용자"].nunique()) if "사용자" in df.columns else 0,
+        "avg_sec": int(avg) if avg is not None and pd.notna(avg) else 0,
+        "today": today_count,
+    }
@@ -0,0 +1,96 @@
+"""
+백그라운드 제출 큐
+
+- "📤 제출하기" 는 로컬 백업만 쓰고 제출 ID 를 바로 돌려받습니다.
+- Storage 업로드 → DB 적재 → log.csv 기록은 스레드 풀에서 재시도와 함께 수행합니다.
+- 화면은 제출 ID 로 상태를 조회(폴링)합니다.
+"""
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+# 상태값
+QUEUED, RUNNING, DONE, FAILED = "queued", "running", "done", "failed"
+
+STATUS_LABELS = {
+    QUEUED: "⏳ 대기 중",
+    RUNNING: "🔄 처리 중",
+    DONE: "✅ 완료",
+    FAILED: "❌ 실패",
+}
+
+
+@dataclass
+class SubmissionJob:
+    id: str
+    username: str
+    meal_type: str
+    status: str = QUEUED
+    step: str = ""
+    storage_path: str = ""
+    local_path: str = ""
+    messages: list[str] = field(default_factory=list)
+    created_at: float = field(default_factory=time.time)
+    finished_at: float | None = None
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (DONE, FAILED)
+
+
+def with_retry(fn, attempts: int = 3, base_delay: float = 0.5):
+    """fn() 을 최대 attempts 회 시도 (지수 백오프). 마지막 예외는 그대로 올립니다."""
+    for i in range(attempts):
+        try:
+            return fn()
+        except Exception:
+            if i == attempts - 1:
+                raise
+            time.sleep(base_delay * (2 ** i))
+
+
+class SubmissionQueue:
+    """제출 작업 큐 (st.cache_resource 로 프로세스당 1개)."""
+
+    def __init__(self, max_workers: int = 4, keep_seconds: int = 3600):
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="submit")
+        self._jobs: dict[str, SubmissionJob] = {}
+        self._lock = threading.Lock()
+        self.keep_seconds = keep_seconds
+
+    def submit(self, worker, *, username: str, meal_type: str, local_path: str = "") -> str:
+        """
+        worker(job) 을 백그라운드에서 실행하고 제출 ID 를 즉시 반환합니다.
+        worker 는 job.step/storage_path/messages 를 갱신하고, 예외를 올리면 실패로 기록됩니다.
+        """
+        job = SubmissionJob(id=uuid.uuid4().hex[:12], username=username,
+                            meal_type=meal_type, local_path=local_path)
+        with self._lock:
+            self._prune()
+            self._jobs[job.id] = job
+        self._pool.submit(self._run, worker, job)
+        return job.id
+
+    def _run(self, worker, job: SubmissionJob):
+        job.status = RUNNING
+        try:
+            worker(job)
+            job.status = DONE
+        except Exception as e:
+            job.messages.append(f"제출 처리 실패: {e}")
+            job.status = FAILED
+        finally:
+            job.step = ""
+            job.finished_at = time.time()
+
+    def get(self, job_id: str) -> SubmissionJob | None:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def _prune(self):
+        # 끝난 지 오래된 작업 정리 (메모리 누수 방지)
+        cutoff = time.time() - self.keep_seconds
+        for jid in [j.id for j in self._jobs.values() if j.finished_at and j.finished_at < cutoff]:
+            del self._jobs[jid]
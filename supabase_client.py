@@ -0,0 +1,215 @@
+"""
+관리형 Supabase 클라이언트
+
+- 하나의 keep-alive httpx 연결 풀을 PostgREST/Storage/TUS 가 함께 사용합니다.
+- 호출별 타임아웃: with managed.timeout(초): ... 블록 안의 요청에만 적용됩니다.
+- 서킷 브레이커: 연속 실패가 쌓이면 일정 시간 요청을 즉시 실패시켜
+  화면이 타임아웃을 기다리지 않고 log.csv 경로로 바로 폴백하게 합니다.
+"""
+import threading
+import time
+from contextlib import contextmanager
+from urllib.parse import quote
+
+import httpx
+from supabase import create_client, Client
+
+try:
+    from supabase.lib.client_options import SyncClientOptions as _ClientOptions
+except ImportError:  # 구버전 supabase-py
+    from supabase.lib.client_options import ClientOptions as _ClientOptions
+
+DEFAULT_TIMEOUT = 10.0
+HEALTH_TIMEOUT = 3.0
+
+CLOSED, OPEN, HALF_OPEN = "closed", "open", "half-open"
+
+
+class CircuitOpenError(httpx.TransportError):
+    """서킷이 열려 있어 요청을 보내지 않음 (httpx 예외 계열이라 기존 예외 처리에 그대로 걸림)."""
+
+
+class CircuitBreaker:
+    """연속 실패 failure_threshold 회 → reset_timeout 초 동안 차단 → 시험 요청 1회 허용."""
+
+    def __init__(self, failure_threshold: int = 3, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._probing = False
+        self._lock = threading.Lock()
+        self.short_circuits = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state()
+
+    def _state(self) -> str:
+        if self._opened_at is None:
+            return CLOSED
+        if time.monotonic() - self._opened_at >= self.reset_timeout:
+            return HALF_OPEN
+        return OPEN
+
+    def retry_in(self) -> float:
+        with self._lock:
+            if self._opened_at is None:
+                return 0.0
+            return max(0.0, self.reset_timeout - (time.monotonic() - self._opened_at))
+
+    def available(self) -> bool:
+        """요청을 보내도 되는 상태인지 (화면 폴백 판단용, 부작용 없음)."""
+        return self.state != OPEN
+
+    def before_request(self) -> bool:
+        with self._lock:
+            state = self._state()
+            if state == CLOSED:
+                return True
+            if state == HALF_OPEN and not self._probing:
+                self._probing = True  # 시험 요청은 한 번에 하나만
+                return True
+            self.short_circuits += 1
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._probing = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._probing or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+            self._probing = False
+
+
+class _ManagedTransport(httpx.BaseTransport):
+    """서킷 브레이커 + 호출별 타임아웃 + 요청 통계를 붙인 httpx 전송 계층."""
+
+    def __init__(self, inner: httpx.HTTPTransport, breaker: CircuitBreaker, local: threading.local):
+        self._inner = inner
+        self._breaker = breaker
+        self._local = local
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.failures = 0
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        override = getattr(self._local, "timeout", None)
+        if override is not None:
+            request.extensions["timeout"] = httpx.Timeout(override).as_dict()
+        if not self._breaker.before_request():
+            raise CircuitOpenError("Supabase circuit open", request=request)
+        with self._lock:
+            self.requests += 1
+        try:
+            response = self._inner.handle_request(request)
+        except Exception:
+            # 전송 오류 외의 예외도 실패로 기록 — 시험 요청 표시(_probing)가 남으면 서킷이 계속 차단됨
+            self._failed()
+            raise
+        # 5xx 는 서버 장애로 간주 (4xx 는 요청 문제이므로 연결은 정상)
+        if response.status_code >= 500:
+            self._failed()
+        else:
+            self._breaker.record_success()
+        return response
+
+    def _failed(self):
+        with self._lock:
+            self.failures += 1
+        self._breaker.record_failure()
+
+    def open_connections(self) -> int | None:
+        try:
+            return len(self._inner._pool.connections)
+        except AttributeError:
+            return None
+
+    def close(self):
+        self._inner.close()
+
+
+class ManagedSupabase:
+    """
+    Supabase Client + 공유 연결 풀 + 서킷 브레이커
+    (st.cache_resource 로 SUPABASE_CLIENT_VERSION 별 1개 — 버전이 바뀌면 새로 연결)
+    """
+
+    def __init__(self, url: str, key: str, version: str = "v1", timeout: float = DEFAULT_TIMEOUT,
+                 storage_timeout: float = 60.0, max_connections: int = 20,
+                 failure_threshold: int = 3, reset_timeout: float = 30.0):
+        self.url = url.rstrip("/")
+        self.key = key
+        self.version = version
+        self.breaker = CircuitBreaker(failure_threshold, reset_timeout)
+        self._local = threading.local()
+        self.transport = _ManagedTransport(
+            httpx.HTTPTransport(limits=httpx.Limits(max_connections=max_connections,
+                                                    max_keepalive_connections=max_connections,
+                                                    keepalive_expiry=60.0)),
+            self.breaker, self._local,
+        )
+        self.http = httpx.Client(transport=self.transport, timeout=timeout)
+        self.client: Client = create_client(url, key, options=self._options(timeout, storage_timeout))
+        self.storage_timeout = storage_timeout
+
+    def _options(self, timeout: float, storage_timeout: float):
+        try:
+            return _ClientOptions(httpx_client=self.http, postgrest_client_timeout=timeout,
+                                  storage_client_timeout=int(storage_timeout))
+        except TypeError:
+            # httpx_client 옵션이 없는 구버전: 타임아웃만 적용 (풀/서킷은 TUS·헬스체크에만)
+            return _ClientOptions(postgrest_client_timeout=timeout,
+                                  storage_client_timeout=int(storage_timeout))
+
+    @contextmanager
+    def timeout(self, seconds: float):
+        """이 블록(현재 스레드)에서 보내는 요청에만 타임아웃을 적용합니다."""
+        prev = getattr(self._local, "timeout", None)
+        self._local.timeout = seconds
+        try:
+            yield
+        finally:
+            self._local.timeout = prev
+
+    def available(self) -> bool:
+        return self.breaker.available()
+
+    def health_check(self) -> bool:
+        """PostgREST 루트에 가벼운 요청을 보내 연결 상태를 확인합니다 (결과는 서킷에 반영)."""
+        try:
+            with self.timeout(HEALTH_TIMEOUT):
+                r = self.http.get(f"{self.url}/rest/v1/", headers={"apikey": self.key,
+                                                                    "Authorization": f"Bearer {self.key}"})
+            return r.status_code < 500
+        except httpx.HTTPError:
+            return False
+
+    def storage_object_exists(self, bucket: str, path: str) -> bool:
+        """Storage 객체가 이미 있는지 HEAD 로 확인합니다 (확인 실패 시 False → 업로드 진행)."""
+        try:
+            r = self.http.head(f"{self.url}/storage/v1/object/{quote(bucket)}/{quote(path)}",
+                               headers={"apikey": self.key, "Authorization": f"Bearer {self.key}"})
+            return r.status_code == 200
+        except httpx.HTTPError:
+            return False
+
+    def stats(self) -> dict:
+        return {
+            "version": self.version,
+            "state": self.breaker.state,
+            "retry_in": round(self.breaker.retry_in(), 1),
+            "requests": self.transport.requests,
+            "failures": self.transport.failures,
+            "short_circuits": self.breaker.short_circuits,
+            "open_connections": self.transport.open_connections(),
+        }
+
+    def close(self):
+        self.http.close()
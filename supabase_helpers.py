@@ -0,0 +1,205 @@
+"""
+Supabase 도우미 (클라이언트/업로드/DB 적재/관리자 조회/서명 URL)
+
+- app.py 에서 분리: 스크립트 전체를 실행하지 않고도 import 할 수 있어 벤치마크(bench/)에서 직접 호출합니다.
+- 연결/전략/캐시 객체는 st.cache_resource 로 SUPABASE_CLIENT_VERSION 별 1개 (버전을 올리면 이전 연결 풀은 닫음).
+"""
+import re
+import threading
+import time
+import unicodedata
+from datetime import datetime
+
+import httpx
+import pandas as pd
+import streamlit as st
+from supabase import Client
+
+from perf_spans import timed
+from signed_urls import SignedUrlCache
+from storage_upload import UploadStrategy, XLSX_MIME
+from submissions import RpcAvailability, SubmissionSnapshot, ADMIN_COLUMNS, DEFAULT_PAGE_SIZE
+from supabase_client import ManagedSupabase
+from tus_upload import TusUploader
+
+
+def client_version() -> str:
+    # ✅ 새 키 반영하려면: secrets에서 버전만 바꿔주면 캐시가 재생성됨
+    return st.secrets.get("SUPABASE_CLIENT_VERSION", "v1")
+
+
+# 지금 쓰는 관리형 클라이언트 (버전 → 객체) — 버전이 바뀌면 이전 것의 연결 풀을 닫기 위해 기억
+_live_clients: dict[str, ManagedSupabase] = {}
+_live_lock = threading.Lock()
+
+
+def _retire_other_versions(current: ManagedSupabase):
+    # 이전 버전의 캐시 항목은 더 이상 조회되지 않으므로 keep-alive 연결만 정리
+    with _live_lock:
+        stale = [m for v, m in _live_clients.items() if v != current.version]
+        _live_clients.clear()
+        _live_clients[current.version] = current
+    for managed in stale:
+        managed.close()
+
+
+@st.cache_resource
+def get_managed_supabase(version: str = "v1") -> ManagedSupabase | None:
+    try:
+        url = st.secrets["SUPABASE_URL"]
+        key = st.secrets["SUPABASE_SERVICE_ROLE_KEY"]
+        managed = ManagedSupabase(
+            url, key, version=version,
+            timeout=float(st.secrets.get("SUPABASE_TIMEOUT", 10)),
+            storage_timeout=float(st.secrets.get("SUPABASE_STORAGE_TIMEOUT", 60)),
+        )
+    except Exception:
+        return None
+    _retire_other_versions(managed)
+    return managed
+
+
+@timed("supabase.get_client")
+def get_supabase(version: str | None = None) -> Client | None:
+    # 버전은 매번 secrets 에서 읽음 → 버전이 바뀌면 자동으로 새 연결
+    # 서킷이 열려 있으면(Supabase 장애) None → 각 화면이 log.csv 경로로 즉시 폴백
+    managed = get_managed_supabase(version=version or client_version())
+    if managed is None or not managed.available():
+        return None
+    return managed.client
+
+
+def _ascii_slug(s: str) -> str:
+    # 한글/유니코드 제거 + 안전 문자만 남기기
+    s = (s or "").strip()
+    s = unicodedata.normalize("NFKD", s)
+    s = s.encode("ascii", "ignore").decode("ascii")
+    s = re.sub(r"[^A-Za-z0-9._-]+", "-", s)
+    s = s.strip("-._")
+    return s or "file"
+
+
+def storage_path_for(username: str, meal_type: str) -> str:
+    u = _ascii_slug(username)
+    m = _ascii_slug(meal_type)
+    ts = time.strftime("%Y%m%d-%H%M%S")
+    fname = f"{u}_{m}_{ts}.xlsx"
+    return f"{u}/{time.strftime('%Y')}/{time.strftime('%m')}/{fname}"  # 버킷명 X
+
+
+@st.cache_resource
+def get_upload_strategy(version: str = "v1") -> UploadStrategy:
+    # 업로드 호환 조합 캐시 — get_managed_supabase 와 같은 버전 키 (클라이언트 교체 시 재탐지)
+    return UploadStrategy()
+
+
+def upload_to_storage(file_bytes: bytes, username: str, meal_type: str, sb: Client | None = None,
+                      strategy: UploadStrategy | None = None, storage_path: str | None = None) -> str:
+    # sb/strategy 를 넘기면 그대로 사용 (백그라운드 스레드에서는 캐시 조회 대신 전달받은 객체 사용)
+    # storage_path 를 넘기면 재시도 시에도 같은 경로로 업로드
+    version = client_version()
+    sb = sb or get_supabase(version=version)
+    if sb is None:
+        raise RuntimeError("Supabase client not configured")
+    strategy = strategy or get_upload_strategy(version=version)
+
+    bucket = st.secrets["SUPABASE_BUCKET"]  # 예: "submissions"
+    path = storage_path or storage_path_for(username, meal_type)
+
+    # 처음에는 호환 조합을 순서대로 시도, 이후에는 탐지된 조합으로 1회만 요청
+    strategy.upload(sb.storage.from_(bucket), path, file_bytes)
+    return path
+
+
+@st.cache_resource
+def get_tus_uploader(version: str = "v1") -> TusUploader | None:
+    # 재개 가능(TUS) 업로드 클라이언트 — 관리형 클라이언트의 연결 풀/서킷을 함께 사용
+    managed = get_managed_supabase(version=version)
+    if managed is None:
+        return None
+    chunk_mb = float(st.secrets.get("SUPABASE_TUS_CHUNK_MB", 6))
+    return TusUploader(managed.url, managed.key, chunk_size=int(chunk_mb * 1024 * 1024), client=managed.http)
+
+
+def resumable_threshold_bytes() -> int:
+    # 이 크기 이상이면 TUS 청크 업로드 사용 (기본 6MB, 0 이면 항상 사용)
+    return int(float(st.secrets.get("SUPABASE_RESUMABLE_MB", 6)) * 1024 * 1024)
+
+
+def upload_to_storage_resumable(fileobj, size: int, storage_path: str, tus: TusUploader) -> str:
+    # 파일 객체를 청크 단위로 전송 — 실패 후 같은 경로로 다시 호출하면 이어서 업로드
+    bucket = st.secrets["SUPABASE_BUCKET"]
+    tus.upload(fileobj, size, bucket, storage_path, content_type=XLSX_MIME, upsert=True)
+    return storage_path
+
+
+def insert_row_kor(username: str, started_at: datetime, submitted_at: datetime,
+                   duration_sec: int, meal_type: str, storage_path: str, original_name: str,
+                   sb: Client | None = None):
+    sb = sb or get_supabase()
+    if sb is None:
+        raise RuntimeError("Supabase client not configured")
+    row = {
+        "사용자": username,
+        "시작시간": started_at.isoformat(),
+        "제출시간": submitted_at.isoformat(),
+        "소요시간(초)": int(duration_sec),
+        "식단표종류": meal_type,
+        "파일경로": storage_path,
+        "원본파일명": original_name,
+    }
+    sb.table("submissions").insert(row).execute()
+
+
+@st.cache_resource
+def get_stats_rpc_availability(version: str = "v1") -> RpcAvailability:
+    # 집계 RPC 미설치 여부 (클라이언트와 같은 범위 — 버전이 바뀌면 다시 확인)
+    return RpcAvailability()
+
+
+@st.cache_resource
+def get_logs_snapshot(page_size: int = DEFAULT_PAGE_SIZE, version: str = "v1") -> SubmissionSnapshot:
+    # 관리자 화면용 submissions 스냅샷 (리런/세션 간 공유, 새 행만 증분 조회)
+    # 클라이언트와 같은 버전 키 → 다른 프로젝트로 바꾸면 이전 프로젝트 행을 계속 보여주지 않음
+    return SubmissionSnapshot(page_size=page_size, columns=ADMIN_COLUMNS)
+
+
+@timed("admin.fetch_logs")
+def fetch_logs_df(page_size: int = DEFAULT_PAGE_SIZE) -> pd.DataFrame:
+    sb = get_supabase()
+    if sb is None:
+        return pd.DataFrame()
+    try:
+        return get_logs_snapshot(page_size, client_version()).refresh(sb)
+    except httpx.HTTPError:
+        # 연결 실패/서킷 차단 → 빈 결과로 log.csv 폴백
+        return pd.DataFrame()
+
+
+@st.cache_resource
+def get_signed_url_cache() -> SignedUrlCache:
+    # 서명 URL 재사용 캐시 (만료 5분 전까지)
+    return SignedUrlCache(refresh_margin=300)
+
+
+def make_signed_url(storage_path: str, expire_seconds: int = 3600) -> str:
+    sb = get_supabase()
+    if sb is None:
+        return ""
+    bucket = st.secrets["SUPABASE_BUCKET"]
+    return get_signed_url_cache().sign_one(sb, bucket, storage_path, expire_seconds)
+
+
+def make_signed_urls(storage_paths, expire_seconds: int = 3600) -> dict[str, str]:
+    # 여러 경로를 한 번의 요청으로 서명 (캐시에 있는 경로는 요청 없음)
+    sb = get_supabase()
+    if sb is None:
+        return {}
+    bucket = st.secrets["SUPABASE_BUCKET"]
+    return get_signed_url_cache().sign_many(sb, bucket, storage_paths, expire_seconds)
+
+
+def cached_signed_urls(storage_paths) -> dict[str, str]:
+    # 이미 발급된(만료 전) URL 만 조회 — 네트워크 요청 없음
+    bucket = st.secrets.get("SUPABASE_BUCKET", "")
+    return get_signed_url_cache().lookup_many(bucket, storage_paths)
@@ -0,0 +1,175 @@
+"""
+식단표 템플릿 레지스트리
+
+- templates/ 의 템플릿을 한 번만 읽어 메모리에 둡니다 (파일 mtime/크기가 바뀔 때만 다시 읽음).
+  리런마다 st.download_button 에 같은 bytes 를 넘기므로 디스크를 다시 읽지 않습니다.
+- 로컬 파일이 없으면 원격 주소(secrets 의 TEMPLATE_URLS, 기본값 GitHub raw)에서 받습니다.
+  받은 뒤에는 revalidate_seconds 마다 If-None-Match/If-Modified-Since 로 재검증하고
+  304 면 본문 없이 캐시를 그대로 씁니다. 원격이 실패하면 마지막으로 받은 사본을 씁니다.
+"""
+import hashlib
+import os
+import threading
+import time
+from dataclasses import dataclass
+
+import httpx
+import streamlit as st
+
+from cache_utils import file_signature
+
+TEMPLATE_DIR = "templates"
+TEMPLATE_FILES = {
+    "식단표A": "식단표 A.xlsx",
+    "식단표B": "식단표 B.xlsx",
+}
+# ⚠️ 반드시 raw.githubusercontent.com 사용 (blob 아님)
+DEFAULT_TEMPLATE_URLS = {
+    "식단표A": "https://raw.githubusercontent.com/hyeridfd/usability_choicen/main/templates/%EC%8B%9D%EB%8B%A8%ED%91%9C%20A.xlsx",
+    "식단표B": "https://raw.githubusercontent.com/hyeridfd/usability_choicen/main/templates/%EC%8B%9D%EB%8B%A8%ED%91%9C%20B.xlsx",
+}
+REMOTE_TIMEOUT = 15.0
+
+
+@dataclass(frozen=True)
+class TemplateFile:
+    meal_type: str
+    data: bytes
+    digest: str        # 내용 sha256 앞 16자리 (파생 캐시 키)
+    source: str        # 로컬 경로 또는 원격 URL
+    etag: str = ""
+    last_modified: str = ""
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()[:16]
+
+
+def template_path(meal_type: str) -> str | None:
+    filename = TEMPLATE_FILES.get(meal_type)
+    return os.path.join(TEMPLATE_DIR, filename) if filename else None
+
+
+class TemplateRegistry:
+    """식단표 종류 → 템플릿 bytes 캐시 (st.cache_resource 로 프로세스당 1개, 모든 세션 공유)."""
+
+    def __init__(self, remote_urls: dict | None = None, revalidate_seconds: float = 300.0,
+                 http: httpx.Client | None = None):
+        self.remote_urls = dict(remote_urls or {})
+        self.revalidate_seconds = revalidate_seconds
+        self._http = http
+        self._local: dict[str, tuple[tuple, TemplateFile]] = {}   # meal_type → (파일 시그니처, 템플릿)
+        self._remote: dict[str, tuple[float, TemplateFile]] = {}  # meal_type → (마지막 확인 시각, 템플릿)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_reads = 0
+        self.remote_fetches = 0
+        self.not_modified = 0
+        self.remote_errors = 0
+
+    def get(self, meal_type: str) -> TemplateFile | None:
+        """로컬 파일 → 원격 순서로 템플릿을 찾습니다 (없으면 None)."""
+        path = template_path(meal_type)
+        sig = file_signature(path) if path else None
+        if sig is not None:
+            return self._get_local(meal_type, sig)
+        if meal_type in self.remote_urls:
+            return self._get_remote(meal_type, self.remote_urls[meal_type])
+        return None
+
+    def get_bytes(self, meal_type: str) -> bytes | None:
+        template = self.get(meal_type)
+        return template.data if template else None
+
+    def _get_local(self, meal_type: str, sig) -> TemplateFile | None:
+        with self._lock:
+            cached = self._local.get(meal_type)
+            if cached and cached[0] == sig:
+                self.hits += 1
+                return cached[1]
+        try:
+            with open(sig[0], "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+        template = TemplateFile(meal_type, data, _digest(data), sig[0])
+        with self._lock:
+            self.disk_reads += 1
+            self._local[meal_type] = (sig, template)
+        return template
+
+    def _get_remote(self, meal_type: str, url: str) -> TemplateFile | None:
+        now = time.monotonic()
+        with self._lock:
+            cached = self._remote.get(meal_type)
+            if cached and now - cached[0] < self.revalidate_seconds:
+                self.hits += 1
+                return cached[1]
+        previous = cached[1] if cached else None
+
+        # 조건부 요청: 바뀌지 않았으면 304 (본문 없음)
+        headers = {}
+        if previous and previous.etag:
+            headers["If-None-Match"] = previous.etag
+        if previous and previous.last_modified:
+            headers["If-Modified-Since"] = previous.last_modified
+        try:
+            r = self._client().get(url, headers=headers, timeout=REMOTE_TIMEOUT, follow_redirects=True)
+            if r.status_code == 304 and previous:
+                template = previous
+                with self._lock:
+                    self.not_modified += 1
+            else:
+                r.raise_for_status()
+                template = TemplateFile(meal_type, r.content, _digest(r.content), url,
+                                        etag=r.headers.get("ETag", ""),
+                                        last_modified=r.headers.get("Last-Modified", ""))
+                with self._lock:
+                    self.remote_fetches += 1
+        except httpx.HTTPError:
+            with self._lock:
+                self.remote_errors += 1
+            if previous is None:
+                return None
+            template = previous  # 원격 장애 → 마지막 사본 (다음 재검증 주기까지 재시도 안 함)
+        with self._lock:
+            self._remote[meal_type] = (time.monotonic(), template)
+        return template
+
+    def _client(self) -> httpx.Client:
+        if self._http is None:
+            self._http = httpx.Client()
+        return self._http
+
+    def invalidate(self, meal_type: str | None = None):
+        """캐시 삭제 (다음 요청 때 로컬은 다시 읽고 원격은 재검증)."""
+        with self._lock:
+            for store in (self._local, self._remote):
+                if meal_type is None:
+                    store.clear()
+                else:
+                    store.pop(meal_type, None)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._local) + len(self._remote),
+                "hits": self.hits,
+                "disk_reads": self.disk_reads,
+                "remote_fetches": self.remote_fetches,
+                "not_modified": self.not_modified,
+                "remote_errors": self.remote_errors,
+            }
+
+
+@st.cache_resource
+def get_template_registry() -> TemplateRegistry:
+    # secrets 의 TEMPLATE_URLS 로 원격 주소 변경 ({} 로 두면 원격 사용 안 함)
+    urls = st.secrets.get("TEMPLATE_URLS", DEFAULT_TEMPLATE_URLS)
+    return TemplateRegistry(remote_urls=dict(urls),
+                            revalidate_seconds=float(st.secrets.get("TEMPLATE_REVALIDATE_SECONDS", 300)))
+
+
+def get_template_file(meal_type: str) -> bytes | None:
+    """템플릿 bytes (다운로드 버튼용). 로컬에도 원격에도 없으면 None."""
+    return get_template_registry().get_bytes(meal_type)
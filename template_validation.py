@@ -0,0 +1,220 @@
+"""
+제출 식단표 검증 (업로드 전)
+
+- 제출 파일을 openpyxl read_only 모드로 행 단위로 읽습니다 (파일 크기와 상관없이 메모리 일정).
+  템플릿 범위(행/열)까지만 읽고 멈춥니다.
+- 템플릿(templates/식단표 A.xlsx, 식단표 B.xlsx — 템플릿 레지스트리)에서 뽑은 구조
+  (시트명, 고정 라벨 셀, 메뉴 칸)를 템플릿 내용 해시 기준으로 캐시해 두고 비교합니다.
+- 구조가 다르면(시트 없음, 라벨 변경, 다른 템플릿) 오류 → 제출(업로드) 전에 막습니다.
+- 템플릿에서 바뀐 메뉴 칸의 메뉴명은 메뉴 카탈로그 검색 인덱스로 확인해
+  카탈로그에 없으면 비슷한 메뉴를 추천합니다 (경고 — 템플릿 자체에도 카탈로그 밖 메뉴가 많아 막지는 않음).
+"""
+import io
+import re
+import zipfile
+from dataclasses import dataclass, field
+
+import openpyxl
+import pandas as pd
+import streamlit as st
+from openpyxl.utils import get_column_letter
+from openpyxl.utils.exceptions import InvalidFileException
+
+from menu_search import get_search_index, normalize_key
+from template_registry import get_template_registry
+
+# 메뉴 칸 하나에 여러 메뉴를 적는 구분자 ("흰밥/잡곡밥/계란죽", "돈까스*소스")
+MENU_SEPARATORS = re.compile(r"[/*]")
+# 메뉴 영역 왼쪽 위 라벨 (이 셀의 행 = 날짜 헤더 행, 오른쪽 열들 = 요일별 메뉴 칸)
+HEADER_LABEL = "구분"
+SUGGESTION_LIMIT = 3
+
+ERROR, WARNING = "error", "warning"
+
+
+@dataclass(frozen=True)
+class TemplateSchema:
+    sheet: str
+    max_row: int
+    max_col: int
+    labels: dict[str, str]       # 셀 → 고정 라벨 ("A3": "구분", "A4": "아침", ...)
+    menu_cells: dict[str, str]   # 셀 → 템플릿 값 (메뉴 칸, 빈 칸은 "")
+    template_menus: frozenset    # 템플릿에 이미 쓰인 메뉴명 (잡곡밥, 소스 등 — 카탈로그에 없어도 허용)
+
+
+@dataclass
+class CellIssue:
+    cell: str
+    message: str
+    severity: str = ERROR
+    suggestions: list[str] = field(default_factory=list)
+
+
+@dataclass
+class ValidationReport:
+    meal_type: str
+    sheet: str = ""
+    issues: list[CellIssue] = field(default_factory=list)
+    check_menus: bool = True
+    checked_menus: int = 0
+
+    @property
+    def errors(self) -> list[CellIssue]:
+        return [i for i in self.issues if i.severity == ERROR]
+
+    @property
+    def warnings(self) -> list[CellIssue]:
+        return [i for i in self.issues if i.severity == WARNING]
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+    def to_frame(self) -> pd.DataFrame:
+        # 화면 표시용 (셀별 오류/경고)
+        return pd.DataFrame([{
+            "구분": "❌ 오류" if i.severity == ERROR else "⚠️ 경고",
+            "시트": self.sheet,
+            "셀": i.cell,
+            "내용": i.message,
+            "추천 메뉴": ", ".join(i.suggestions),
+        } for i in self.issues], columns=["구분", "시트", "셀", "내용", "추천 메뉴"])
+
+
+def _text(value) -> str:
+    return " ".join(str(value).split()) if value is not None else ""
+
+
+def _is_formula(value) -> bool:
+    return isinstance(value, str) and value.startswith("=")
+
+
+def split_menus(text: str) -> list[str]:
+    return [t.strip() for t in MENU_SEPARATORS.split(text) if t.strip()]
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _template_schema_cached(digest: str, _data: bytes) -> TemplateSchema:
+    # digest(내용 해시)만 캐시 키 (_data 는 해시하지 않음) — 템플릿이 바뀌면 다시 추출
+    wb = openpyxl.load_workbook(io.BytesIO(_data), read_only=True)
+    try:
+        ws = wb.worksheets[0]
+        rows = [list(r) for r in ws.iter_rows(values_only=True)]
+        sheet = ws.title
+    finally:
+        wb.close()
+    max_row = len(rows)
+    max_col = max((len(r) for r in rows), default=0)
+    cell = lambda r, c: rows[r][c] if c < len(rows[r]) else None
+
+    # 1) "구분" 라벨 오른쪽으로 헤더(날짜/수식)가 이어지는 열 = 메뉴 칸, 그 아래 행 전부
+    menu_area = set()
+    for r in range(max_row):
+        for c in range(max_col):
+            if _text(cell(r, c)) != HEADER_LABEL:
+                continue
+            cc = c + 1
+            while cc < max_col and cell(r, cc) is not None:
+                menu_area.update((rr, cc) for rr in range(r + 1, max_row))
+                cc += 1
+
+    # 2) 메뉴 칸 밖의 문자열(수식 제외) = 고정 라벨
+    labels, menu_cells = {}, {}
+    for r in range(max_row):
+        for c in range(max_col):
+            coord = f"{get_column_letter(c + 1)}{r + 1}"
+            value = cell(r, c)
+            if (r, c) in menu_area:
+                menu_cells[coord] = _text(value)
+            elif isinstance(value, str) and value.strip() and not _is_formula(value):
+                labels[coord] = _text(value)
+    template_menus = frozenset(normalize_key(m) for v in menu_cells.values() for m in split_menus(v))
+    return TemplateSchema(sheet, max_row, max_col, labels, menu_cells, template_menus)
+
+
+def get_template_schema(meal_type: str) -> TemplateSchema | None:
+    """식단표 종류별 템플릿 구조 (템플릿이 없으면 None)."""
+    template = get_template_registry().get(meal_type)
+    return _template_schema_cached(template.digest, template.data) if template else None
+
+
+def validate_submission(fileobj, meal_type: str, check_menus: bool = True) -> ValidationReport:
+    """
+    제출 파일(경로 또는 파일 객체)을 meal_type 템플릿 구조와 메뉴 카탈로그로 검증합니다.
+    report.ok 가 False 면 업로드하지 않습니다. 파일 객체는 처음 위치로 되돌려 둡니다.
+    """
+    report = ValidationReport(meal_type, check_menus=check_menus)
+    schema = get_template_schema(meal_type)
+    if schema is None:
+        # 비교할 템플릿이 없으면 검증 생략 (기존처럼 그대로 접수)
+        return report
+    report.sheet = schema.sheet
+
+    if hasattr(fileobj, "seek"):
+        fileobj.seek(0)
+    try:
+        _scan_workbook(report, schema, fileobj)
+    finally:
+        if hasattr(fileobj, "seek"):
+            fileobj.seek(0)
+    return report
+
+
+def _scan_workbook(report: ValidationReport, schema: TemplateSchema, fileobj):
+    try:
+        wb = openpyxl.load_workbook(fileobj, read_only=True)
+    except (zipfile.BadZipFile, InvalidFileException, KeyError, OSError) as e:
+        report.issues.append(CellIssue("-", f"엑셀(xlsx) 파일을 열 수 없습니다: {e}"))
+        return
+
+    changed = []  # (셀, 값) — 템플릿과 달라진 메뉴 칸
+    filled = 0
+    seen = set()
+    try:
+        # 1) 시트
+        if schema.sheet not in wb.sheetnames:
+            report.issues.append(CellIssue("-", f"'{schema.sheet}' 시트가 없습니다 (현재: {', '.join(wb.sheetnames)})"))
+            return
+        ws = wb[schema.sheet]
+
+        # 2) 템플릿 범위까지만 한 행씩 읽으며 라벨/메뉴 칸 확인
+        for r, row in enumerate(ws.iter_rows(min_row=1, max_row=schema.max_row, max_col=schema.max_col,
+                                             values_only=True), start=1):
+            for c, value in enumerate(row, start=1):
+                coord = f"{get_column_letter(c)}{r}"
+                text = _text(value)
+                expected = schema.labels.get(coord)
+                if expected is not None:
+                    seen.add(coord)
+                    if text != expected:
+                        report.issues.append(CellIssue(coord, f"'{expected}' 이어야 합니다 (현재: '{text}')"))
+                elif coord in schema.menu_cells and isinstance(value, str) and text and not _is_formula(value):
+                    filled += 1
+                    if text != schema.menu_cells[coord]:
+                        changed.append((coord, text))
+    finally:
+        wb.close()
+
+    # 시트가 템플릿보다 짧아 읽지 못한 라벨
+    for coord, expected in schema.labels.items():
+        if coord not in seen:
+            report.issues.append(CellIssue(coord, f"'{expected}' 이어야 합니다 (현재: 비어 있음)"))
+    if filled == 0:
+        report.issues.append(CellIssue("-", "메뉴 칸이 모두 비어 있습니다"))
+    # 구조 오류가 있으면 어차피 반려 → 메뉴 확인은 생략
+    if report.check_menus and changed and report.ok:
+        _check_menus(report, schema, changed)
+
+
+def _check_menus(report: ValidationReport, schema: TemplateSchema, changed: list[tuple[str, str]]):
+    # 3) 바뀐 메뉴 칸의 메뉴명 → 카탈로그 확인 (없으면 추천)
+    index = get_search_index()
+    if index is None:
+        return
+    for coord, text in changed:
+        for name in split_menus(text):
+            report.checked_menus += 1
+            if index.contains(name) or normalize_key(name) in schema.template_menus:
+                continue
+            suggestions = [index.menus[i] for i in index.search(name, limit=SUGGESTION_LIMIT)]
+            report.issues.append(CellIssue(coord, f"메뉴 카탈로그에 없는 메뉴: '{name}'", WARNING, suggestions))
@@ -0,0 +1,144 @@
+"""
+Supabase Storage 재개 가능(TUS) 업로드
+
+- {SUPABASE_URL}/storage/v1/upload/resumable 엔드포인트에 청크 단위로 전송합니다.
+- 파일 객체(UploadedFile 등)를 청크씩 읽어 보내므로 전체 복사본을 만들지 않습니다.
+- 실패하면 HEAD 로 서버가 받은 오프셋을 확인한 뒤 그 지점부터 이어서 보냅니다.
+"""
+import base64
+import threading
+import time
+from urllib.parse import urljoin
+
+import httpx
+
+TUS_VERSION = "1.0.0"
+# Supabase 는 마지막 청크를 제외하고 6MB 청크를 요구합니다
+DEFAULT_CHUNK_SIZE = 6 * 1024 * 1024
+
+
+def _b64(s: str) -> str:
+    return base64.b64encode(s.encode("utf-8")).decode("ascii")
+
+
+class TusError(RuntimeError):
+    pass
+
+
+class TusUploadGone(TusError):
+    """재개하려던 업로드 URL 이 만료/삭제됨 → 새로 생성해야 함."""
+
+
+class TusUploader:
+    """
+    TUS 업로드 클라이언트 (st.cache_resource 로 보관 — HTTP 연결과 재개 정보 유지)
+
+    - 같은 (버킷, 객체 경로, 크기)로 다시 호출하면 이전 업로드 URL 에서 이어서 보냅니다.
+    """
+
+    def __init__(self, supabase_url: str, api_key: str, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 timeout: float = 30.0, max_retries: int = 3, client: httpx.Client | None = None):
+        self.endpoint = supabase_url.rstrip("/") + "/storage/v1/upload/resumable"
+        self.chunk_size = chunk_size
+        self.max_retries = max_retries
+        self._headers = {
+            "authorization": f"Bearer {api_key}",
+            "apikey": api_key,
+            "Tus-Resumable": TUS_VERSION,
+        }
+        self._client = client or httpx.Client(timeout=timeout)
+        self._resume: dict[tuple, str] = {}
+        self._lock = threading.Lock()
+
+    # --- TUS 프로토콜 -------------------------------------------------
+    def create(self, size: int, bucket: str, object_name: str, content_type: str,
+               upsert: bool = True, cache_control: str = "3600") -> str:
+        metadata = ",".join([
+            f"bucketName {_b64(bucket)}",
+            f"objectName {_b64(object_name)}",
+            f"contentType {_b64(content_type)}",
+            f"cacheControl {_b64(cache_control)}",
+        ])
+        r = self._client.post(self.endpoint, headers={
+            **self._headers,
+            "Upload-Length": str(size),
+            "Upload-Metadata": metadata,
+            "x-upsert": "true" if upsert else "false",
+        })
+        if r.status_code != 201 or "location" not in r.headers:
+            raise TusError(f"TUS create failed: {r.status_code} {r.text[:200]}")
+        return urljoin(self.endpoint + "/", r.headers["location"])
+
+    def offset(self, url: str) -> int:
+        r = self._client.head(url, headers=self._headers)
+        if r.status_code in (404, 410):
+            raise TusUploadGone(f"TUS upload expired: {r.status_code}")
+        if r.status_code != 200 or "upload-offset" not in r.headers:
+            raise TusError(f"TUS HEAD failed: {r.status_code}")
+        return int(r.headers["upload-offset"])
+
+    def _patch(self, url: str, offset: int, chunk: bytes) -> int:
+        r = self._client.patch(url, content=chunk, headers={
+            **self._headers,
+            "Upload-Offset": str(offset),
+            "Content-Type": "application/offset+octet-stream",
+        })
+        if r.status_code == 409:
+            # 오프셋 불일치 → 서버 기준 오프셋으로 다시 맞춤
+            return self.offset(url)
+        if r.status_code not in (200, 204) or "upload-offset" not in r.headers:
+            raise TusError(f"TUS PATCH failed: {r.status_code} {r.text[:200]}")
+        return int(r.headers["upload-offset"])
+
+    # --- 업로드 -------------------------------------------------------
+    def upload(self, fileobj, size: int, bucket: str, object_name: str,
+               content_type: str = "application/octet-stream", upsert: bool = True) -> int:
+        """
+        fileobj(seek/read 지원)를 청크 단위로 업로드하고 전송한 바이트 수를 반환합니다.
+        연속 실패가 max_retries 를 넘으면 예외를 올리며, 재개 정보는 남겨 둡니다.
+        """
+        key = (bucket, object_name, size)
+        with self._lock:
+            url = self._resume.get(key)
+
+        sent, failures = 0, 0
+        offset = None
+        while True:
+            try:
+                if url is None:
+                    url = self.create(size, bucket, object_name, content_type, upsert)
+                    with self._lock:
+                        self._resume[key] = url
+                    offset = 0
+                elif offset is None:
+                    offset = self.offset(url)  # 재개: 서버가 받은 지점 확인
+                if offset >= size:
+                    break
+                fileobj.seek(offset)
+                chunk = fileobj.read(min(self.chunk_size, size - offset))
+                new_offset = self._patch(url, offset, chunk)
+                sent += max(0, new_offset - offset)
+                offset = new_offset
+                failures = 0
+            except TusUploadGone:
+                # 만료된 업로드는 처음부터 다시 (실패 횟수에는 포함)
+                with self._lock:
+                    self._resume.pop(key, None)
+                url, offset = None, None
+                failures += 1
+                if failures > self.max_retries:
+                    raise
+            except (httpx.HTTPError, TusError):
+                failures += 1
+                if failures > self.max_retries:
+                    raise
+                offset = None  # 다음 시도에서 HEAD 로 오프셋 재확인
+                time.sleep(0.5 * (2 ** (failures - 1)))
+        with self._lock:
+            self._resume.pop(key, None)
+        return sent
+
+    def pending(self) -> int:
+        """완료되지 않아 재개 가능한 업로드 수."""
+        with self._lock:
+            return len(self._resume)
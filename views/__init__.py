@@ -0,0 +1,14 @@
+"""
+화면(페이지) 모듈
+
+app.py 는 로그인 여부와 선택한 탭에 맞는 모듈만 import 합니다.
+로그인 화면 리런에서는 pandas / supabase / openpyxl 을 불러오지 않고,
+한 번 import 한 모듈은 이후 리런에서 그대로 재사용됩니다 (sys.modules).
+
+- login: 로그인
+- submit: 사용자 식단 제출
+- admin: 관리자 대시보드
+- menu: 메뉴 관리
+- common: 여러 화면이 쓰는 경로·계정·공유 자원
+- style: 공통 CSS
+"""
@@ -0,0 +1,166 @@
+"""
+관리자 대시보드 (제출 통계·기록, 다운로드 링크, 연결/캐시/성능 현황)
+"""
+import os
+from functools import partial
+
+import pandas as pd
+import streamlit as st
+
+from perf_spans import render_perf_panel, span
+from submission_log import read_log_df
+from submissions import DEFAULT_PAGE_SIZE, compute_stats, fetch_submission_stats
+from supabase_client import ManagedSupabase
+from supabase_helpers import (
+    cached_signed_urls, client_version, fetch_logs_df, get_logs_snapshot, get_managed_supabase,
+    get_stats_rpc_availability, get_supabase, get_upload_strategy, make_signed_url, make_signed_urls,
+)
+from template_registry import get_template_registry
+from views.common import LOG_FILE, ensure_log_schema, get_backup_index, get_blob_store
+
+
+def _read_file(path: str) -> bytes:
+    # 다운로드 버튼을 눌렀을 때만 실행 (리런마다 파일을 열지 않음)
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def render_stat_cards(stats: dict):
+    # 총 제출 수 / 참여 사용자 / 평균 소요시간 / 오늘 제출
+    cards = [
+        (stats["total"], "총 제출 수"),
+        (stats["users"], "참여 사용자"),
+        (f"{stats['avg_sec']}초", "평균 소요시간"),
+        (stats["today"], "오늘 제출"),
+    ]
+    for col, (number, label) in zip(st.columns(4), cards):
+        with col:
+            st.markdown(f"""<div class="stat-card"><div class="stat-number">{number}</div><div class="stat-label">{label}</div></div>""", unsafe_allow_html=True)
+
+
+def render_connection_status(managed: ManagedSupabase):
+    # Supabase 연결 상태 (서킷/요청/연결 풀) + 수동 상태 확인
+    stats = managed.stats()
+    if stats["state"] == "closed":
+        st.caption(f"🟢 Supabase 연결 정상 · 요청 {stats['requests']} · 실패 {stats['failures']}"
+                   f" · 열린 연결 {stats['open_connections'] if stats['open_connections'] is not None else '-'}")
+    else:
+        st.caption(f"🔴 Supabase 연결 차단 중 ({stats['retry_in']}초 후 재시도) · 차단된 요청 {stats['short_circuits']}"
+                   " — log.csv 기준으로 표시합니다")
+    if st.button("🩺 연결 상태 확인", key="sb_health_check"):
+        ok = managed.health_check()
+        (st.success if ok else st.error)("Supabase 응답 정상" if ok else "Supabase 응답 없음")
+
+
+def render_template_cache_status():
+    # 템플릿 캐시 현황 + 템플릿 교체 후 새로고침
+    t_stats = get_template_registry().stats()
+    st.caption(f"📄 템플릿 캐시 — 적중 {t_stats['hits']} · 파일 읽기 {t_stats['disk_reads']}"
+               f" · 원격 받기 {t_stats['remote_fetches']} · 304 {t_stats['not_modified']}")
+    if st.button("🔄 템플릿 캐시 새로고침", key="template_cache_refresh", use_container_width=True):
+        get_template_registry().invalidate()
+        st.rerun()
+
+
+def render():
+    ensure_log_schema()
+    st.markdown("""
+    <div class="admin-header">
+        <h1>🔧 관리자 페이지</h1>
+        <p>시스템 관리 및 제출 기록 확인</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # 통계 카드 + 표
+    managed = get_managed_supabase(version=client_version())
+    if managed:
+        with st.sidebar:
+            render_connection_status(managed)
+            if st.button("🔄 제출 기록 새로고침", key="submissions_refresh", use_container_width=True):
+                # 스냅샷은 새 행만 증분 조회 → Supabase 에서 지우거나 고친 행은 전체를 다시 읽어야 반영
+                get_logs_snapshot(DEFAULT_PAGE_SIZE, client_version()).reset()
+    with st.sidebar:
+        render_template_cache_status()
+        render_perf_panel()
+    sb = get_supabase()
+    up_stats = get_upload_strategy(version=client_version()).stats()
+    if up_stats["uploads"]:
+        st.caption(f"📤 Storage 업로드 {up_stats['uploads']}건 · 평균 시도 {up_stats['attempts_avg']}회 · 실패 {up_stats['failures']}건")
+    blob_stats = get_blob_store().stats()
+    if blob_stats["uploads_skipped"] or blob_stats["local_dedup"]:
+        st.caption(f"♻️ 중복 제출 — 업로드 생략 {blob_stats['uploads_skipped']}건"
+                   f" ({blob_stats['bytes_saved'] / 1024 / 1024:.1f}MB 절약) · 로컬 중복 {blob_stats['local_dedup']}건")
+    cards_slot = st.container()
+    # 집계 RPC 로 카드 먼저 표시 (테이블 전송 전) — RPC 미설치로 확인되면 한동안 호출 생략
+    rpc_availability = get_stats_rpc_availability(client_version())
+    with span("admin.stats_rpc"):
+        db_stats = fetch_submission_stats(sb, availability=rpc_availability) if sb else None
+    if db_stats and db_stats["total"] > 0:
+        with cards_slot:
+            render_stat_cards(db_stats)
+    df_db = fetch_logs_df() if sb else pd.DataFrame()
+
+    if not df_db.empty:
+        # Supabase 기준 통계 (RPC 미설치 시 스냅샷에서 계산)
+        if not (db_stats and db_stats["total"] > 0):
+            with cards_slot:
+                render_stat_cards(compute_stats(df_db))
+
+        st.markdown("""<div class="card"><h3>📊 제출 기록</h3></div>""", unsafe_allow_html=True)
+        show_cols = ["사용자","시작시간","제출시간","소요시간(초)","식단표종류","파일경로","원본파일명"]
+        st.dataframe(df_db[[c for c in show_cols if c in df_db.columns]], use_container_width=True)
+
+        st.markdown("<br>", unsafe_allow_html=True)
+        # ✅ 스냅샷의 사용자별 인덱스 (새 제출만 증분 반영) → 표 전체 필터/정렬 없이 O(k)
+        snapshot = get_logs_snapshot(DEFAULT_PAGE_SIZE, client_version())
+        sel_user = st.selectbox("👤 사용자 선택", snapshot.users())
+
+        user_rows = snapshot.user_rows(sel_user)
+        # 서명 URL 은 필요할 때만 발급: 캐시된 URL 은 바로 링크, 나머지는 클릭 시 발급
+        user_paths = [p for p in (r.get("파일경로") for r in user_rows) if isinstance(p, str) and p]
+        with span("admin.signed_urls"):
+            signed_map = cached_signed_urls(user_paths)
+        missing = [p for p in user_paths if p not in signed_map]
+        if missing and st.button(f"🔗 다운로드 링크 모두 만들기 ({len(missing)}건)", use_container_width=True):
+            with span("admin.signed_urls"):
+                signed_map.update(make_signed_urls(missing, expire_seconds=3600))
+        for i, r in enumerate(user_rows):
+            label = f"📥 {r.get('원본파일명') or '제출파일'} ({r.get('식단표종류')} / {str(r.get('제출시간'))[:19]})"
+            path = r.get("파일경로")
+            if not isinstance(path, str) or not path:
+                st.warning(f"URL 생성 실패 또는 로컬 파일만 존재: {path}")
+                continue
+            signed = signed_map.get(path)
+            if not signed and st.button(label, key=f"sign_{sel_user}_{i}", use_container_width=True):
+                with span("admin.signed_urls"):
+                    signed = make_signed_url(path, expire_seconds=3600)
+                if not signed:
+                    st.warning(f"URL 생성 실패 또는 로컬 파일만 존재: {path}")
+            if signed:
+                st.link_button(label, url=signed, use_container_width=True)
+    else:
+        # 폴백: 기존 log.csv + 로컬 다운로드
+        if os.path.exists(LOG_FILE):
+            df = read_log_df(LOG_FILE)
+            render_stat_cards(compute_stats(df))
+
+            st.markdown("""<div class="card"><h3>📊 제출 기록</h3></div>""", unsafe_allow_html=True)
+            st.dataframe(df, use_container_width=True)
+
+            st.markdown("<br>", unsafe_allow_html=True)
+            col1, col2 = st.columns(2)
+            with col1:
+                user_list = df["사용자"].unique().tolist()
+                selected_user = st.selectbox("👤 사용자 선택", user_list)
+            with col2:
+                # ✅ 백업 인덱스 (폴더는 처음/외부 변경 시에만 훑음), 파일 내용은 버튼을 누를 때만 읽음
+                files = get_backup_index().files(selected_user)
+                if files:
+                    for f in files:
+                        label = f"📥 {os.path.splitext(f.name)[0]} 다운로드 ({f.size / 1024:,.0f}KB)"
+                        st.download_button(label=label, data=partial(_read_file, f.path), file_name=f.name,
+                                           use_container_width=True)
+                else:
+                    st.warning(f"⚠️ {selected_user}님의 제출 파일이 존재하지 않습니다.")
+        else:
+            st.info("📝 제출 기록이 아직 없습니다.")
@@ -0,0 +1,64 @@
+"""
+여러 화면이 함께 쓰는 설정과 공유 자원
+
+- 경로(log.csv / uploads / templates), 계정, KST 시각
+- 프로세스당 1개인 자원: 제출 파일 blob 저장소·백업 인덱스, 백그라운드 제출 큐, log.csv 스키마 보정
+  (모듈 함수의 st.cache_resource → 리런마다 app.py 가 다시 실행돼도 그대로 유지)
+"""
+import os
+from datetime import datetime, timezone
+from zoneinfo import ZoneInfo
+
+import streamlit as st
+
+from blob_store import BackupIndex, BlobStore
+from submit_queue import SubmissionQueue
+
+LOG_FILE = "log.csv"
+UPLOAD_FOLDER = "uploads"
+MENU_XLSX = "menu.xlsx"
+TEMPLATE_FOLDER = "templates"
+
+os.makedirs(UPLOAD_FOLDER, exist_ok=True)
+os.makedirs(TEMPLATE_FOLDER, exist_ok=True)
+
+# 사용자 계정
+user_dict = {
+    "SR01": "test01", "SR02": "test02", "SR03": "test03", "SR04": "test04",
+    "SR05": "test05", "SR06": "test06", "SR07": "test07", "SR08": "test08",
+    "SR09": "test09", "SR10": "test10", "SR11": "test11", "SR12": "test12",
+    "SR13": "test13", "admin": "admin"
+}
+
+
+def get_kst_now():
+    return datetime.now(timezone.utc).astimezone(ZoneInfo("Asia/Seoul"))
+
+
+@st.cache_resource
+def _migrate_log_once(path: str) -> list[str]:
+    # log.csv 누락 컬럼(파일경로/식단표종류) 보정 — 프로세스당 1회
+    from submission_log import migrate_log_schema  # pandas — 로그를 쓰는 화면에서만 불러옴
+    return migrate_log_schema(path)
+
+
+def ensure_log_schema():
+    _migrate_log_once(LOG_FILE)
+
+
+@st.cache_resource
+def get_blob_store() -> BlobStore:
+    # 제출 파일 내용 주소 저장소 (uploads/blobs, 프로세스당 1개)
+    return BlobStore(os.path.join(UPLOAD_FOLDER, "blobs"))
+
+
+@st.cache_resource
+def get_backup_index() -> BackupIndex:
+    # 제출별 로컬 백업 목록 (사용자 → 최신순, 제출마다 add 로 갱신)
+    return BackupIndex(UPLOAD_FOLDER)
+
+
+@st.cache_resource
+def get_submit_queue() -> SubmissionQueue:
+    # 백그라운드 제출 큐 (프로세스당 1개, 모든 세션 공유)
+    return SubmissionQueue(max_workers=4)
@@ -0,0 +1,31 @@
+"""
+로그인 화면 (무거운 의존성 없음 — streamlit 과 계정 정보만 사용)
+"""
+import streamlit as st
+
+from views.common import user_dict
+
+
+def render():
+    st.markdown("<br>", unsafe_allow_html=True)
+    st.markdown("""
+    <div class="login-card">
+        <h1 style="color: #667eea; margin-bottom: 0.5rem;">🍽️</h1>
+        <h2 style="color: #2c3e50; margin-bottom: 0.5rem;">식단 설계 시스템</h2>
+        <p style="color: #7f8c8d; margin-bottom: 2rem;">로그인하여 시작하세요</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    with st.container():
+        col1, col2, col3 = st.columns([1, 2, 1])
+        with col2:
+            username = st.text_input("👤 아이디", placeholder="아이디를 입력하세요")
+            password = st.text_input("🔒 비밀번호", type="password", placeholder="비밀번호를 입력하세요")
+
+            if st.button("🚀 로그인", use_container_width=True):
+                if username in user_dict and user_dict[username] == password:
+                    st.session_state.logged_in = True
+                    st.session_state.username = username
+                    st.rerun()
+                else:
+                    st.error("❌ 아이디 또는 비밀번호가 올바르지 않습니다.")
@@ -0,0 +1,28 @@
+"""
+메뉴 관리 화면 (메뉴 컴포넌트 + 관리자용 카탈로그 캐시 새로고침)
+"""
+import streamlit as st
+
+from menu_component import get_catalog_json_cache, invalidate_catalog_cache, menu_manager
+from perf_spans import span
+
+
+def render():
+    # st.markdown("""
+    # <div class="user-header">
+    #     <h1>🔍 메뉴 관리</h1>
+    #     <p>메뉴 데이터베이스 조회 및 검색</p>
+    # </div>
+    # """, unsafe_allow_html=True)
+
+    with span("menu.render"):
+        menu_manager()
+
+    # 관리자: 메뉴 파일 교체 후 캐시 새로고침 + 캐시 현황
+    if st.session_state.username == "admin":
+        with st.sidebar:
+            cache_stats = get_catalog_json_cache().stats()
+            st.caption(f"🗂️ 메뉴 카탈로그 캐시 — 적중 {cache_stats['hits']} / 미스 {cache_stats['misses']}")
+            if st.button("🔄 메뉴 캐시 새로고침", use_container_width=True):
+                invalidate_catalog_cache()
+                st.rerun()
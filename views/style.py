@@ -0,0 +1,110 @@
+"""
+앱 공통 CSS
+"""
+import streamlit as st
+
+APP_CSS = """
+<style>
+/* 메인 배경 */
+.main {
+    padding: 2rem 3rem;
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    min-height: 100vh;
+}
+.card {
+    background: white;
+    padding: 2rem;
+    border-radius: 15px;
+    box-shadow: 0 10px 30px rgba(0,0,0,0.1);
+    margin-bottom: 2rem;
+    border: 1px solid rgba(255,255,255,0.2);
+}
+.login-card {
+    max-width: 400px;
+    margin: 5rem auto;
+    background: white;
+    padding: 3rem;
+    border-radius: 20px;
+    box-shadow: 0 15px 35px rgba(0,0,0,0.1);
+    text-align: center;
+}
+.success-banner {
+    background: linear-gradient(90deg, #56ab2f, #a8e6cf);
+    color: white;
+    padding: 1rem;
+    border-radius: 10px;
+    text-align: center;
+    font-weight: 600;
+    margin-bottom: 2rem;
+}
+.admin-header {
+    background: linear-gradient(90deg, #667eea, #764ba2);
+    color: white;
+    padding: 1.5rem;
+    border-radius: 10px;
+    text-align: center;
+    margin-bottom: 2rem;
+}
+.user-header {
+    background: linear-gradient(90deg, #4facfe, #00f2fe);
+    color: white;
+    padding: 1.5rem;
+    border-radius: 10px;
+    text-align: center;
+    margin-bottom: 2rem;
+}
+.stButton > button {
+    background: linear-gradient(45deg, #667eea, #764ba2);
+    color: white;
+    border: none;
+    padding: 0.75rem 2rem;
+    border-radius: 25px;
+    font-weight: 600;
+    transition: all 0.3s ease;
+    box-shadow: 0 4px 15px rgba(102, 126, 234, 0.3);
+}
+.stButton > button:hover {
+    transform: translateY(-2px);
+    box-shadow: 0 6px 20px rgba(102, 126, 234, 0.4);
+}
+.danger-button button {
+    background: linear-gradient(45deg, #ff416c, #ff4b2b) !important;
+    box-shadow: 0 4px 15px rgba(255, 65, 108, 0.3) !important;
+}
+.start-button button {
+    background: linear-gradient(45deg, #56ab2f, #a8e6cf) !important;
+    box-shadow: 0 4px 15px rgba(86, 171, 47, 0.3) !important;
+    font-size: 1.1rem !important;
+    padding: 1rem 2.5rem !important;
+}
+.stat-card {
+    background: white;
+    padding: 1.5rem;
+    border-radius: 10px;
+    text-align: center;
+    box-shadow: 0 4px 15px rgba(0,0,0,0.1);
+    margin: 0.5rem;
+}
+.stat-number {
+    font-size: 2rem;
+    font-weight: 700;
+    color: #667eea;
+}
+.stat-label {
+    color: #7f8c8d;
+    font-size: 0.9rem;
+    margin-top: 0.5rem;
+}
+/* 사이드바 스타일 */
+.css-1d391kg {
+    background: linear-gradient(180deg, #667eea 0%, #764ba2 100%);
+}
+section[data-testid="stSidebar"] > div {
+    background: linear-gradient(180deg, #667eea 0%, #764ba2 100%);
+}
+</style>
+"""
+
+
+def inject_css():
+    st.markdown(APP_CSS, unsafe_allow_html=True)
@@ -0,0 +1,300 @@
+"""
+사용자 식단 제출 화면 (템플릿 다운로드 → 식단표 선택 → 시작 → 업로드 검증 → 백그라운드 제출)
+"""
+import os
+from datetime import datetime
+from functools import partial
+
+import streamlit as st
+
+from blob_store import BlobRef, BlobStore, storage_object_path
+from perf_spans import span, timed
+from storage_upload import UploadStrategy
+from submission_log import append_log_row
+from submit_queue import STATUS_LABELS, with_retry
+from supabase_client import ManagedSupabase
+from supabase_helpers import (
+    client_version, get_managed_supabase, get_tus_uploader, get_upload_strategy, insert_row_kor,
+    resumable_threshold_bytes, storage_path_for, upload_to_storage, upload_to_storage_resumable,
+)
+from template_registry import get_template_file
+from template_validation import ValidationReport, validate_submission
+from tus_upload import TusUploader
+from views.common import (
+    LOG_FILE, UPLOAD_FOLDER, ensure_log_schema, get_backup_index, get_blob_store, get_kst_now, get_submit_queue,
+)
+
+
+@timed("submit.process")
+def process_submission(job, managed: ManagedSupabase | None, strategy: UploadStrategy, tus: TusUploader | None,
+                       fileobj, file_size: int, started_at: datetime, submit_time: datetime,
+                       duration_sec: int, original_name: str, blob: BlobRef | None = None,
+                       blobs: BlobStore | None = None, bucket: str = ""):
+    """
+    백그라운드 작업: Storage 업로드 → log.csv 기록 → DB 적재 (각 단계 재시도)
+    managed/strategy/tus/blobs/bucket 은 스크립트 스레드에서 미리 얻어 전달합니다 (작업 스레드에는 세션 컨텍스트가 없음).
+    서킷이 열려 있으면 Supabase 단계는 건너뛰고 로컬 백업만 남깁니다.
+    fileobj 는 UploadedFile — 큰 파일은 청크로 읽어 보내고, 작은 파일만 bytes 로 꺼냅니다.
+    blob 이 있으면 내용 해시 경로로 올리고, 이미 올라간 내용이면 업로드를 건너뜁니다.
+    """
+    sb = managed.client if managed and managed.available() else None
+
+    # 1) Supabase 업로드 (실패 시 로컬 백업 경로로 대체)
+    if sb:
+        # 경로를 한 번만 정해야 재시도 시 같은 객체로 이어서 업로드됩니다
+        path = storage_object_path(blob.sha256) if blob else storage_path_for(job.username, job.meal_type)
+        try:
+            # 업로드는 DB 호출보다 긴 타임아웃 (이 블록의 요청에만 적용)
+            with span("submit.storage_upload"), managed.timeout(managed.storage_timeout):
+                if blob and blobs and (blobs.is_uploaded(bucket, path) or managed.storage_object_exists(bucket, path)):
+                    # ✅ 같은 내용이 이미 Storage 에 있음 → 업로드 생략
+                    job.step = "Storage 업로드(중복 — 생략)"
+                    job.storage_path = path
+                    blobs.record_skip(file_size)
+                elif tus and file_size >= resumable_threshold_bytes():
+                    job.step = "Storage 업로드(청크)"
+                    job.storage_path = with_retry(lambda: upload_to_storage_resumable(fileobj, file_size, path, tus))
+                else:
+                    job.step = "Storage 업로드"
+                    file_bytes = fileobj.getvalue()
+                    job.storage_path = with_retry(lambda: upload_to_storage(file_bytes, job.username, job.meal_type,
+                                                                              sb=sb, strategy=strategy,
+                                                                              storage_path=path))
+            if blob and blobs and job.storage_path:
+                blobs.mark_uploaded(bucket, job.storage_path)
+        except Exception as e:
+            job.messages.append(f"Supabase 업로드 실패(로컬 저장으로 대체): {e}")
+
+    # 2) 로그 CSV 추가
+    job.step = "로그 기록"
+    with span("submit.log_csv"):
+        append_log_row(LOG_FILE, {
+            "사용자": job.username,
+            "시작시간": started_at.strftime('%Y-%m-%d %H:%M:%S'),
+            "제출시간": submit_time.strftime('%Y-%m-%d %H:%M:%S'),
+            "소요시간(초)": duration_sec,
+            "식단표종류": job.meal_type,
+            "파일경로": job.storage_path or job.local_path,  # Supabase 경로 우선
+        })
+
+    # 3) (선택) Supabase DB 로그
+    if sb and job.storage_path:
+        job.step = "DB 적재"
+        try:
+            with span("submit.db_insert"):
+                with_retry(lambda: insert_row_kor(job.username, started_at, submit_time, duration_sec,
+                                                  job.meal_type, job.storage_path, original_name, sb=sb))
+        except Exception as e:
+            job.messages.append(f"Supabase 로그 적재 실패: {e}")
+
+
+def get_upload_report(uploaded_file, meal_type: str) -> ValidationReport:
+    # 같은 파일·같은 식단표면 리런마다 다시 읽지 않음 (세션에 보관)
+    key = (uploaded_file.file_id, meal_type)
+    cached = st.session_state.get("upload_validation")
+    if cached and cached[0] == key:
+        return cached[1]
+    with st.spinner("📋 식단표 확인 중..."), span("submit.validate"):
+        report = validate_submission(uploaded_file, meal_type)
+    st.session_state.upload_validation = (key, report)
+    return report
+
+
+def render_validation_report(report: ValidationReport):
+    # 셀별 오류/경고 표시 (오류가 있으면 제출 버튼 비활성화)
+    if not report.ok:
+        st.error(f"❌ 템플릿({report.meal_type})과 맞지 않아 제출할 수 없습니다 — 오류 {len(report.errors)}건. "
+                 "아래 셀을 고친 뒤 다시 업로드해주세요.")
+    elif report.warnings:
+        st.warning(f"⚠️ 메뉴 카탈로그에 없는 메뉴 {len(report.warnings)}건 — 추천 메뉴를 확인해주세요. (제출은 가능합니다)")
+    if report.issues:
+        st.dataframe(report.to_frame(), use_container_width=True, hide_index=True)
+
+
+def render_submission_status():
+    # 이 세션에서 접수한 제출의 처리 상태 (처리 중이면 1초마다 갱신)
+    job_ids = st.session_state.get("pending_submissions", [])
+    if not job_ids:
+        return
+    queue = get_submit_queue()
+    jobs = [j for j in (queue.get(jid) for jid in job_ids) if j]
+    polling = any(not j.finished for j in jobs)
+
+    @st.fragment(run_every=1.0 if polling else None)
+    def _status_panel():
+        current = [j for j in (queue.get(jid) for jid in job_ids) if j]
+        for j in current:
+            step = f" — {j.step}" if j.step else ""
+            where = j.storage_path or j.local_path
+            st.markdown(f"**{STATUS_LABELS.get(j.status, j.status)}{step}** · {j.meal_type} · 제출 ID `{j.id}`"
+                        + (f" · 🗄️ {where}" if j.finished else ""))
+            for msg in j.messages:
+                st.warning(msg)
+        # 모두 끝나면 폴링 중단을 위해 전체 리런 1회
+        if polling and all(j.finished for j in current):
+            st.rerun()
+
+    _status_panel()
+
+
+def render():
+    ensure_log_schema()
+    # 템플릿 다운로드 섹션 추가
+    st.markdown("""
+    <div class="card">
+        <h3>📥 식단표 템플릿 다운로드</h3>
+        <p>작업에 필요한 식단표 템플릿을 먼저 다운로드하세요.</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    col1, col2 = st.columns(2)
+    with col1:
+        # 식단표A 다운로드
+        template_a = get_template_file("식단표A")
+        if template_a:
+            st.download_button(
+                label="📊 식단표 A 다운로드",
+                data=template_a,
+                file_name="식단표_A_템플릿.xlsx",
+                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                use_container_width=True
+            )
+        else:
+            st.info("📋 식단표 A 템플릿을 templates/ 폴더에 배치해주세요")
+
+    with col2:
+        # 식단표B 다운로드
+        template_b = get_template_file("식단표B")
+        if template_b:
+            st.download_button(
+                label="📊 식단표 B 다운로드",
+                data=template_b,
+                file_name="식단표_B_템플릿.xlsx",
+                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                use_container_width=True
+            )
+        else:
+            st.info("📋 식단표 B 템플릿을 templates/ 폴더에 배치해주세요")
+
+    st.markdown("<br>", unsafe_allow_html=True)
+    # 식단표 선택
+    st.markdown("""
+    <div class="card">
+        <h3>🧾 식단표 선택</h3>
+        <p>작업하실 식단표를 먼저 선택해주세요.</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    st.session_state.meal_type = st.radio(
+        "식단표 유형",
+        options=["식단표A", "식단표B"],
+        index=0 if st.session_state.meal_type == "식단표A" else 1,
+        horizontal=True
+    )
+
+    # 시작 버튼 섹션
+    st.markdown("""
+    <div class="card">
+        <h3>🚀 작업 시작</h3>
+        <p>아래 버튼을 클릭하여 식단 개선 작업을 시작하세요.</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    if st.session_state.start_time is None:
+        col1, col2 = st.columns([1, 1])
+        with col1:
+            st.markdown('<div class="start-button">', unsafe_allow_html=True)
+            if st.button("🍽️ 식단 설계 시작", use_container_width=True):
+                st.session_state.start_time = get_kst_now()
+                st.success(f"⏰ 시작 시간: {st.session_state.start_time.strftime('%H:%M:%S')}")
+                st.rerun()
+            st.markdown('</div>', unsafe_allow_html=True)
+    else:
+        # 진행 중 상태 표시
+        current_time = get_kst_now()
+        elapsed = current_time - st.session_state.start_time
+        elapsed_seconds = int(elapsed.total_seconds())
+
+        st.markdown(f"""
+        <div style="background: linear-gradient(90deg, #56ab2f, #a8e6cf); color: white; padding: 1rem; border-radius: 10px; text-align: center; margin-bottom: 2rem;">
+            ⏱️ 작업 진행 중... | 시작 시간: {st.session_state.start_time.strftime('%H:%M:%S')} | 경과 시간: {elapsed_seconds}초 | 선택: {st.session_state.meal_type}
+        </div>
+        """, unsafe_allow_html=True)
+
+        # 파일 업로드 섹션
+        st.markdown("""
+        <div class="card">
+            <h3>📁 파일 업로드</h3>
+            <p>완성된 식단 설계 엑셀 파일을 업로드해주세요.</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+        uploaded_file = st.file_uploader(
+            "📊 엑셀 파일 선택",
+            type=["xlsx"],
+            help="템플릿을 채운 xlsx 파일만 업로드 가능합니다."
+        )
+
+        if uploaded_file:
+            st.success(f"✅ 파일 선택됨: {uploaded_file.name}")
+
+            # ✅ 업로드 전 검증: 템플릿 구조 + 메뉴 카탈로그 (파일/식단표별 1회)
+            report = get_upload_report(uploaded_file, st.session_state.meal_type)
+            render_validation_report(report)
+
+            col1, col2, col3 = st.columns([1, 2, 1])
+            with col2:
+                if st.button("📤 제출하기", use_container_width=True, disabled=not report.ok):
+                    # --- 필수: 여기서 모두 지역 변수로 만든다 ---
+                    submit_time  = get_kst_now()
+                    started_at   = st.session_state.start_time or submit_time
+                    duration_sec = max(0, int((submit_time - started_at).total_seconds()))
+                    username     = st.session_state.username
+                    safe_meal    = st.session_state.meal_type
+                    save_name    = f"{username}_{safe_meal}_{submit_time.strftime('%Y%m%d-%H%M%S')}.xlsx"
+                    original_name = uploaded_file.name
+
+                    # 로컬에 먼저 저장(폴백/백업) — 제출 경로에서 기다리는 유일한 I/O
+                    # (청크로 복사하며 SHA-256 계산 → 같은 내용은 blob 하나, 제출별 백업은 하드링크)
+                    blobs = get_blob_store()
+                    with span("submit.local_backup"):
+                        blob = blobs.put_stream(uploaded_file)
+                        file_path = blobs.link(blob, os.path.join(UPLOAD_FOLDER, save_name))
+                    get_backup_index().add(file_path)  # 관리자 사용자별 백업 목록에 바로 반영
+
+                    # Supabase 업로드/DB 적재/로그 기록은 백그라운드 큐에서 처리
+                    version = client_version()
+                    managed = get_managed_supabase(version=version)
+                    strategy = get_upload_strategy(version=version)
+                    tus = get_tus_uploader(version=version) if managed else None
+                    file_size = uploaded_file.size
+                    submission_id = get_submit_queue().submit(
+                        partial(process_submission, managed=managed, strategy=strategy, tus=tus,
+                                fileobj=uploaded_file, file_size=file_size, started_at=started_at,
+                                submit_time=submit_time, duration_sec=duration_sec,
+                                original_name=original_name, blob=blob, blobs=blobs,
+                                bucket=st.secrets.get("SUPABASE_BUCKET", "")),
+                        username=username, meal_type=safe_meal, local_path=file_path,
+                    )
+                    st.session_state.setdefault("pending_submissions", []).append(submission_id)
+
+                    # 완료 메시지 (여기서 지역 변수만 사용!)
+                    st.success("🎉 제출이 접수되었습니다! 업로드는 백그라운드에서 진행됩니다.")
+                    st.markdown(f"""
+                    <div style="background: #e8f5e8; padding: 1.5rem; border-radius: 10px; margin: 1rem 0;">
+                        <h4>📋 제출 완료 요약</h4>
+                        <p><strong>👤 사용자:</strong> {username}</p>
+                        <p><strong>🧾 식단표:</strong> {safe_meal}</p>
+                        <p><strong>⏰ 소요 시간:</strong> {duration_sec}초</p>
+                        <p><strong>📅 제출 시간:</strong> {submit_time.strftime('%Y-%m-%d %H:%M:%S')}</p>
+                        <p><strong>💾 저장 파일명:</strong> {save_name}</p>
+                        <p><strong>🆔 제출 ID:</strong> {submission_id}</p>
+                        <p><strong>🗄️ 로컬 백업:</strong> {file_path}</p>
+                    </div>
+                    """, unsafe_allow_html=True)
+
+                    # 세션 리셋
+                    st.session_state.start_time = None
+
+    # 접수된 제출의 백그라운드 처리 상태
+    render_submission_status()